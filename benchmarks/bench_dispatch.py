@@ -0,0 +1,99 @@
+"""Benchmark per-request JSON-RPC dispatch and validation cost.
+
+Compares the precompiled method registry against the previous approach of
+decoding the body, building a JsonRpcRequest, an if/elif method chain and a
+second per-method request model. Handlers are no-ops so only dispatch and
+validation are measured.
+
+Usage:
+    python -m benchmarks.bench_dispatch [iterations]
+"""
+
+import asyncio
+import json
+import sys
+import time
+
+from pydantic import BaseModel
+
+from mcp_server.api.jsonrpc import MethodRegistry
+from mcp_server.models.request import (
+    JsonRpcRequest,
+    SendTaskRequest,
+    TaskIdParams,
+    TaskSendParams,
+)
+from mcp_server.models.response import JsonRpcResponse, SendTaskResponse
+from mcp_server.models.task import Message
+
+EXTRA_METHODS = 10
+
+REQUEST = json.dumps(
+    {
+        "jsonrpc": "2.0",
+        "id": "req-1",
+        "method": "tasks/send",
+        "params": {
+            "id": "task-1",
+            "sessionId": "session-1",
+            "message": {
+                "role": "user",
+                "parts": [{"type": "text", "text": "Summarize this document " * 20}],
+            },
+        },
+    }
+).encode("utf-8")
+
+
+async def _noop(request_id, params, context):
+    return {"id": request_id, "result": {"taskId": params.id}}
+
+
+def build_registry() -> MethodRegistry:
+    """Build a registry with the task methods plus extra plugin methods."""
+    registry = MethodRegistry()
+    registry.register("tasks/send", TaskSendParams, _noop)
+    registry.register("tasks/sendSubscribe", TaskSendParams, _noop)
+    for index in range(EXTRA_METHODS):
+        registry.register(f"plugin/method{index}", TaskIdParams, _noop)
+    registry.build()
+    return registry
+
+
+async def legacy_dispatch(raw: bytes) -> dict:
+    """Dispatch the way handle_jsonrpc did before the registry."""
+    data = json.loads(raw)
+    jsonrpc_request = JsonRpcRequest(**data)
+    if jsonrpc_request.method == "tasks/send":
+        request = SendTaskRequest(id=jsonrpc_request.id, params=jsonrpc_request.params)
+        message = Message(**request.params.get("message", {}))
+        response: BaseModel = SendTaskResponse(
+            id=request.id, result={"taskId": request.params["id"], "role": message.role}
+        )
+    else:
+        for index in range(EXTRA_METHODS):
+            if jsonrpc_request.method == f"plugin/method{index}":
+                break
+        response = JsonRpcResponse(id=jsonrpc_request.id, error={"code": -32601})
+    return response.model_dump()
+
+
+async def measure(name: str, dispatch, iterations: int) -> None:
+    for _ in range(1000):
+        await dispatch(REQUEST)
+    start = time.perf_counter()
+    for _ in range(iterations):
+        await dispatch(REQUEST)
+    elapsed = time.perf_counter() - start
+    print(f"{name:<10} {elapsed / iterations * 1e6:8.2f} us/request")
+
+
+async def main(iterations: int) -> None:
+    registry = build_registry()
+    print(f"{len(registry.methods)} registered methods, {iterations} iterations")
+    await measure("legacy", legacy_dispatch, iterations)
+    await measure("registry", registry.dispatch, iterations)
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 50000))
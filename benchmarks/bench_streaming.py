@@ -0,0 +1,89 @@
+"""Benchmark accumulating streamed handler output into a task message.
+
+Compares appending one Part dict per chunk, concatenating each chunk onto
+the previous text part, and the buffered MessageBuilder, then runs the
+echo handler end to end through TaskManager.
+
+Usage:
+    python -m benchmarks.bench_streaming [chunks]
+"""
+
+import asyncio
+import sys
+import time
+
+from mcp_server.models.request import SendTaskRequest
+from mcp_server.models.task import Message
+from mcp_server.services.task_handlers import (
+    EchoHandler,
+    HandlerRegistry,
+    MessageBuilder,
+)
+from mcp_server.services.task_manager import TaskManager
+
+CHUNK = {"type": "text", "text": " token"}
+
+
+def part_per_chunk(chunks: int) -> Message:
+    """Append a new Part dict for every chunk."""
+    message = Message(role="agent", parts=[])
+    for _ in range(chunks):
+        message.parts.append(dict(CHUNK))
+    return message
+
+
+def concatenate(chunks: int) -> Message:
+    """Merge every chunk into the previous text part immediately."""
+    message = Message(role="agent", parts=[{"type": "text", "text": ""}])
+    for _ in range(chunks):
+        message.parts[-1]["text"] += CHUNK["text"]
+    return message
+
+
+def builder(chunks: int) -> Message:
+    """Merge chunks with MessageBuilder."""
+    message_builder = MessageBuilder(Message(role="agent", parts=[]))
+    for _ in range(chunks):
+        message_builder.append([CHUNK])
+    return message_builder.flush()
+
+
+def measure(name: str, accumulate, chunks: int) -> None:
+    start = time.perf_counter()
+    message = accumulate(chunks)
+    elapsed = time.perf_counter() - start
+    print(
+        f"{name:<16} {elapsed * 1000:9.2f} ms  "
+        f"{chunks / elapsed:12,.0f} chunks/s  {len(message.parts):>8} parts"
+    )
+
+
+async def end_to_end(chunks: int) -> None:
+    handlers = HandlerRegistry(default=EchoHandler(repeat=chunks))
+    task_manager = TaskManager(handlers=handlers)
+    request = SendTaskRequest(
+        id="req-1",
+        params={
+            "id": "task-1",
+            "message": {"role": "user", "parts": [{"type": "text", "text": "token"}]},
+        },
+    )
+    start = time.perf_counter()
+    await task_manager.on_send_task(request)
+    elapsed = time.perf_counter() - start
+    print(
+        f"{'task manager':<16} {elapsed * 1000:9.2f} ms  "
+        f"{chunks / elapsed:12,.0f} chunks/s"
+    )
+
+
+def main(chunks: int) -> None:
+    print(f"{chunks} streamed chunks of {len(CHUNK['text'])} characters")
+    measure("part per chunk", part_per_chunk, chunks)
+    measure("concatenate", concatenate, chunks)
+    measure("message builder", builder, chunks)
+    asyncio.run(end_to_end(chunks))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50000)
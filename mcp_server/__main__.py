@@ -2,10 +2,19 @@
 
 import asyncio
 import logging
-from aiohttp import web
+import signal
 
-from mcp_server.app import create_app
-from mcp_server.config import get_settings
+from mcp_server.startup import get_startup_timer
+
+timer = get_startup_timer()
+timer.time_package("mcp_server")
+
+with timer.timed_import("aiohttp"):
+    from aiohttp import web
+with timer.timed_import("pydantic"):
+    import pydantic  # noqa: F401
+from mcp_server.app import create_app, shutdown_gracefully  # noqa: E402
+from mcp_server.config import get_settings  # noqa: E402
 
 logging.basicConfig(
     level=logging.INFO,
@@ -15,23 +24,60 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def _report_first_connection(runner: web.AppRunner) -> None:
+    """Log the time to the first accepted connection."""
+    server = runner.server
+    original = server.connection_made
+
+    def connection_made(handler, transport) -> None:
+        del server.connection_made  # restore the class method
+        timer.mark("first connection accepted")
+        logger.info(
+            f"First connection accepted {timer.elapsed() * 1000:.1f} ms after start"
+        )
+        original(handler, transport)
+
+    server.connection_made = connection_made
+
+
 async def main() -> None:
     """Initialize and run the MCP server."""
     settings = get_settings()
     app = await create_app()
+    timer.mark("application created")
 
     logger.info(f"Starting MCP server on {settings.host}:{settings.port}")
-    runner = web.AppRunner(app)
+    runner = web.AppRunner(app, keepalive_timeout=settings.keepalive_timeout)
     await runner.setup()
-    site = web.TCPSite(runner, settings.host, settings.port)
+    site = web.TCPSite(
+        runner,
+        settings.host,
+        settings.port,
+        backlog=settings.listen_backlog,
+        reuse_port=settings.reuse_port or None,
+    )
+
+    # Shut down on SIGTERM or SIGINT; a second signal gets the default
+    # handler back and stops the process immediately
+    loop = asyncio.get_running_loop()
+    stop = asyncio.Event()
+    signals = (signal.SIGTERM, signal.SIGINT)
+    for sig in signals:
+        loop.add_signal_handler(sig, stop.set)
 
     try:
         await site.start()
+        timer.mark("listening")
         logger.info(f"MCP server running at http://{settings.host}:{settings.port}")
-        # Run forever
-        await asyncio.Event().wait()
-    except KeyboardInterrupt:
+        if settings.debug:
+            logger.info(timer.report())
+            _report_first_connection(runner)
+        await stop.wait()
+
+        for sig in signals:
+            loop.remove_signal_handler(sig)
         logger.info("Shutting down MCP server")
+        await shutdown_gracefully(app, site)
     finally:
         await runner.cleanup()
 
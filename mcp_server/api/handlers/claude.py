@@ -5,6 +5,7 @@ import logging
 from aiohttp import web
 from typing import Dict, Any
 
+from mcp_server.api.handlers.tasks import TIMEOUT_HEADER
 from mcp_server.services.task_manager import TaskManager
 from mcp_server.models.task import TaskState, Message
 
@@ -52,7 +53,15 @@ class ClaudeHandler:
                     }]
                 }
             }
+            timeout = data.get("timeout", request.headers.get(TIMEOUT_HEADER))
+            if timeout is not None:
+                task_params["timeout"] = timeout
             
+            if not self.task_manager.accepting:
+                return web.json_response(
+                    {"error": "Server is shutting down"}, status=503
+                )
+
             # Process request based on streaming preference
             if stream:
                 # Create streaming task
@@ -75,6 +84,12 @@ class ClaudeHandler:
                     params=task_params
                 )
                 response = await self.task_manager.on_send_task(send_request)
+                if response.error is not None:
+                    # -32000: interrupted by shutdown, retry on another instance
+                    status = 503 if response.error["code"] == -32000 else 400
+                    return web.json_response(
+                        {"error": response.error["message"]}, status=status
+                    )
                 
                 # Extract response text
                 result = response.result
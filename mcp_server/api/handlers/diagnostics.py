@@ -0,0 +1,98 @@
+"""Diagnostics handlers for the MCP server."""
+
+import hmac
+import logging
+import math
+from aiohttp import web
+
+from mcp_server.config import get_settings
+from mcp_server.services.diagnostics import LoopDiagnostics
+
+logger = logging.getLogger(__name__)
+
+# Shortest sampling interval accepted from a request, in seconds
+MIN_PROFILE_INTERVAL = 0.001
+
+
+class DiagnosticsHandler:
+    """Admin handler exposing event-loop diagnostics."""
+
+    def __init__(self, diagnostics: LoopDiagnostics):
+        """Initialize the diagnostics handler.
+
+        Args:
+            diagnostics: The loop diagnostics service
+        """
+        self.diagnostics = diagnostics
+
+    async def get_diagnostics(self, request: web.Request) -> web.Response:
+        """Return loop lag statistics and recorded slow callbacks.
+
+        Args:
+            request: The HTTP request object
+
+        Returns:
+            Diagnostics report
+        """
+        self._check_admin(request)
+        return web.json_response(self.diagnostics.snapshot())
+
+    async def start_profile(self, request: web.Request) -> web.Response:
+        """Start sampling the event loop for a time window.
+
+        Args:
+            request: The HTTP request object, with optional "duration" and
+                "interval" query parameters in seconds
+
+        Returns:
+            Confirmation, or 409 if a profile is already running
+        """
+        self._check_admin(request)
+        settings = get_settings()
+        try:
+            duration = float(request.query.get("duration", "5"))
+            interval = float(request.query.get("interval", "0.005"))
+        except ValueError:
+            return web.json_response({"error": "Invalid duration"}, status=400)
+        if not (math.isfinite(duration) and math.isfinite(interval)):
+            return web.json_response({"error": "Invalid duration"}, status=400)
+        if duration <= 0 or interval <= 0:
+            return web.json_response({"error": "Invalid duration"}, status=400)
+        duration = min(duration, settings.profile_max_duration)
+        interval = max(interval, MIN_PROFILE_INTERVAL)
+
+        if not self.diagnostics.start_profile(duration, interval):
+            return web.json_response({"error": "Profile already running"}, status=409)
+
+        logger.info(f"Started event-loop profile for {duration:g}s")
+        return web.json_response(
+            {"status": "started", "duration": duration}, status=202
+        )
+
+    async def get_profile(self, request: web.Request) -> web.Response:
+        """Return the most recent completed profile.
+
+        Args:
+            request: The HTTP request object
+
+        Returns:
+            Collapsed stack sample counts
+        """
+        self._check_admin(request)
+        if self.diagnostics.last_profile is None:
+            return web.json_response({"error": "No profile available"}, status=404)
+        return web.json_response(
+            {
+                "profiling": self.diagnostics.profiling,
+                **self.diagnostics.last_profile,
+            }
+        )
+
+    def _check_admin(self, request: web.Request) -> None:
+        """Require the admin bearer token."""
+        token = get_settings().admin_token
+        expected = f"Bearer {token}".encode("utf-8")
+        provided = request.headers.get("Authorization", "").encode("utf-8")
+        # Constant-time comparison, so the token cannot be guessed by timing
+        if not token or not hmac.compare_digest(provided, expected):
+            raise web.HTTPUnauthorized(reason="Unauthorized")
@@ -13,3 +13,23 @@ async def health_check(request: web.Request) -> web.Response:
         HTTP response with status information
     """
     return web.json_response({"status": "healthy"})
+
+
+async def readiness_check(request: web.Request) -> web.Response:
+    """Handle readiness probe requests.
+
+    Unlike the health check this reports 503 until startup warmup has
+    finished, so load balancers only route traffic to a warmed-up server.
+
+    Args:
+        request: The HTTP request object
+
+    Returns:
+        HTTP response with readiness information
+    """
+    readiness = request.app["readiness"]
+    if not readiness.ready:
+        return web.json_response(
+            {"status": "not ready", "reason": readiness.reason}, status=503
+        )
+    return web.json_response({"status": "ready"})
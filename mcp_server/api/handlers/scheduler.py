@@ -0,0 +1,129 @@
+"""Scheduled task handlers for the MCP server."""
+
+import logging
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+from mcp_server.api.jsonrpc import INVALID_PARAMS, MethodRegistry, error_response
+from mcp_server.models.request import TaskIdParams, TaskScheduleParams
+from mcp_server.services.scheduler import TaskScheduler
+
+logger = logging.getLogger(__name__)
+
+
+def _isoformat(timestamp: Optional[float]) -> Optional[str]:
+    """Format epoch seconds as an ISO 8601 UTC time."""
+    if timestamp is None:
+        return None
+    return datetime.fromtimestamp(timestamp, timezone.utc).isoformat()
+
+
+def _entry_result(entry: Dict[str, Any]) -> Dict[str, Any]:
+    """Describe a schedule entry in a JSON-RPC result."""
+    return {
+        "id": entry["id"],
+        "sessionId": entry["sessionId"],
+        "priority": entry["priority"],
+        "runAt": _isoformat(entry["runAt"]),
+        "interval": entry["interval"],
+        "runs": entry["runs"],
+        "failedRuns": [
+            {**failure, "at": _isoformat(failure["at"])}
+            for failure in entry["failedRuns"]
+        ],
+    }
+
+
+class SchedulerHandler:
+    """Handler for the task scheduling JSON-RPC methods."""
+
+    def __init__(self, scheduler: TaskScheduler, methods: MethodRegistry):
+        """Initialize the scheduler handler and register its JSON-RPC methods.
+
+        Args:
+            scheduler: The task scheduler service
+            methods: The JSON-RPC method registry
+        """
+        self.scheduler = scheduler
+        methods.register("tasks/schedule", TaskScheduleParams, self.schedule)
+        methods.register("tasks/unschedule", TaskIdParams, self.unschedule)
+        methods.register("tasks/getSchedule", TaskIdParams, self.get_schedule)
+
+    async def schedule(
+        self, request_id: Any, params: TaskScheduleParams, context: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Handle the tasks/schedule method.
+
+        Args:
+            request_id: JSON-RPC request ID
+            params: Validated method params
+            context: Transport context
+
+        Returns:
+            The JSON-RPC response describing the schedule
+        """
+        run_at = None
+        if params.runAt is not None:
+            # Times without a zone are taken as UTC, like task timestamps
+            if params.runAt.tzinfo is None:
+                run_at = params.runAt.replace(tzinfo=timezone.utc).timestamp()
+            else:
+                run_at = params.runAt.timestamp()
+
+        task_params = params.model_dump(
+            mode="json",
+            exclude={"runAt", "interval", "priority"},
+            exclude_none=True,
+        )
+        # The webhook token is excluded from serialization but has to be
+        # stored with the schedule for the runs to use it
+        if params.pushNotification and params.pushNotification.token:
+            task_params["pushNotification"]["token"] = params.pushNotification.token
+        if task_params.get("timeout") is None and context.get("timeout"):
+            task_params["timeout"] = context["timeout"]
+
+        try:
+            entry = self.scheduler.schedule(
+                task_params,
+                run_at=run_at,
+                interval=params.interval,
+                priority=params.priority,
+            )
+        except ValueError as e:
+            return error_response(request_id, INVALID_PARAMS, f"Invalid params: {e}")
+        return {"id": request_id, "result": _entry_result(entry)}
+
+    async def unschedule(
+        self, request_id: Any, params: TaskIdParams, context: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Handle the tasks/unschedule method.
+
+        Args:
+            request_id: JSON-RPC request ID
+            params: Validated method params
+            context: Transport context
+
+        Returns:
+            The JSON-RPC response
+        """
+        if not self.scheduler.unschedule(params.id):
+            return error_response(request_id, -32001, "Schedule not found")
+        return {"id": request_id, "result": {"ok": True}}
+
+    async def get_schedule(
+        self, request_id: Any, params: TaskIdParams, context: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Handle the tasks/getSchedule method.
+
+        Args:
+            request_id: JSON-RPC request ID
+            params: Validated method params
+            context: Transport context
+
+        Returns:
+            The JSON-RPC response describing the schedule
+        """
+        entry = self.scheduler.get(params.id)
+        if entry is None:
+            return error_response(request_id, -32001, "Schedule not found")
+        return {"id": request_id, "result": _entry_result(entry)}
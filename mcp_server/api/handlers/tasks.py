@@ -1,36 +1,48 @@
 """Task request handlers for the MCP server."""
 
+import asyncio
 import json
 import logging
-from aiohttp import web
+from aiohttp import hdrs, web
 from typing import Dict, Any, Optional
 
+from mcp_server.api.jsonrpc import INVALID_PARAMS, MethodRegistry, error_response
+from mcp_server.compression import StreamCompressor, negotiate_encoding
+from mcp_server.config import get_settings
 from mcp_server.services.task_manager import TaskManager
-from mcp_server.models.task import Task, TaskState
+from mcp_server.models.task import TERMINAL_STATES, Task
 from mcp_server.models.request import (
-    JsonRpcRequest,
     SendTaskRequest,
     SubscribeTaskRequest,
+    TaskListParams,
+    TaskSendParams,
 )
 from mcp_server.models.response import (
-    JsonRpcResponse,
     SendTaskResponse,
     SubscribeTaskResponse,
 )
 
 logger = logging.getLogger(__name__)
 
+# Header a client may use to bound task execution time, in seconds
+TIMEOUT_HEADER = "X-Request-Timeout"
+
 
 class TasksHandler:
     """Handler for task-related requests."""
 
-    def __init__(self, task_manager: TaskManager):
-        """Initialize the tasks handler.
+    def __init__(self, task_manager: TaskManager, methods: MethodRegistry):
+        """Initialize the tasks handler and register its JSON-RPC methods.
 
         Args:
             task_manager: The task manager service
+            methods: The JSON-RPC method registry
         """
         self.task_manager = task_manager
+        self.methods = methods
+        methods.register("tasks/send", TaskSendParams, self.send_task)
+        methods.register("tasks/sendSubscribe", TaskSendParams, self.send_subscribe)
+        methods.register("tasks/list", TaskListParams, self.list_tasks)
 
     async def handle_jsonrpc(self, request: web.Request) -> web.Response:
         """Handle JSON-RPC requests.
@@ -42,30 +54,11 @@ class TasksHandler:
             JSON-RPC response
         """
         try:
-            data = await request.json()
-            jsonrpc_request = JsonRpcRequest(**data)
-
-            # Handle different methods
-            if jsonrpc_request.method == "tasks/send":
-                send_request = SendTaskRequest(
-                    id=jsonrpc_request.id, params=jsonrpc_request.params
-                )
-                response = await self.task_manager.on_send_task(send_request)
-            elif jsonrpc_request.method == "tasks/sendSubscribe":
-                subscribe_request = SubscribeTaskRequest(
-                    id=jsonrpc_request.id, params=jsonrpc_request.params
-                )
-                response = await self.task_manager.on_subscribe_task(subscribe_request)
-            else:
-                response = JsonRpcResponse(
-                    id=jsonrpc_request.id,
-                    error={
-                        "code": -32601,
-                        "message": f"Method {jsonrpc_request.method} not found",
-                    },
-                )
-
-            return web.json_response(response.dict())
+            raw = await request.read()
+            response = await self.methods.dispatch(
+                raw, {"timeout": request.headers.get(TIMEOUT_HEADER)}
+            )
+            return web.json_response(response)
         except Exception as e:
             logger.error(f"Error handling JSON-RPC request: {e}")
             return web.json_response(
@@ -77,6 +70,97 @@ class TasksHandler:
                 status=500,
             )
 
+    async def send_task(
+        self, request_id: Any, params: TaskSendParams, context: Dict[str, Any]
+    ) -> SendTaskResponse:
+        """Handle the tasks/send method.
+
+        Args:
+            request_id: JSON-RPC request ID
+            params: Validated method params
+            context: Transport context
+
+        Returns:
+            The task result
+        """
+        send_request = SendTaskRequest.model_construct(
+            id=request_id, params=self._task_params(params, context)
+        )
+        return await self.task_manager.on_send_task(send_request)
+
+    async def send_subscribe(
+        self, request_id: Any, params: TaskSendParams, context: Dict[str, Any]
+    ) -> Any:
+        """Handle the tasks/sendSubscribe method.
+
+        Over the WebSocket transport the connection starts following the
+        task before it is created, so no early event can be missed.
+
+        Args:
+            request_id: JSON-RPC request ID
+            params: Validated method params
+            context: Transport context, with "connection" for WebSockets
+
+        Returns:
+            The subscription result
+        """
+        connection = context.get("connection")
+        if connection is not None and not connection.subscribe(params.id):
+            return error_response(request_id, -32000, "Too many subscriptions")
+
+        subscribe_request = SubscribeTaskRequest.model_construct(
+            id=request_id, params=self._task_params(params, context)
+        )
+        response = await self.task_manager.on_subscribe_task(subscribe_request)
+        if connection is not None and response.error is not None:
+            connection.unsubscribe(params.id)
+        return response
+
+    async def list_tasks(
+        self, request_id: Any, params: TaskListParams, context: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Handle the tasks/list method.
+
+        Args:
+            request_id: JSON-RPC request ID
+            params: Validated method params
+            context: Transport context
+
+        Returns:
+            The JSON-RPC response with one page of tasks
+        """
+        try:
+            tasks, next_cursor = self.task_manager.list_tasks(
+                params.limit,
+                session_id=params.sessionId,
+                state=params.state,
+                updated_after=params.updatedAfter,
+                cursor=params.cursor,
+            )
+        except ValueError as e:
+            return error_response(request_id, INVALID_PARAMS, f"Invalid params: {e}")
+        return {
+            "id": request_id,
+            "result": {
+                "tasks": [task.model_dump(mode="json") for task in tasks],
+                "nextCursor": next_cursor,
+            },
+        }
+
+    def _task_params(
+        self, params: TaskSendParams, context: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Convert validated params to the task manager's params dict.
+
+        The conversion is shallow, so nested models such as the message are
+        passed on already validated.
+        """
+        task_params = dict(params)
+        # A JSON-RPC "timeout" param takes precedence over the header
+        if task_params.get("timeout") is None:
+            task_params["timeout"] = context.get("timeout")
+        return task_params
+
     async def stream_task(self, request: web.Request) -> web.StreamResponse:
         """Stream task updates using Server-Sent Events.
 
@@ -102,29 +186,63 @@ class TasksHandler:
         response.headers["Content-Type"] = "text/event-stream"
         response.headers["Cache-Control"] = "no-cache"
         response.headers["Connection"] = "keep-alive"
+
+        compressor = None
+        if get_settings().compression_enabled:
+            encoding = negotiate_encoding(request.headers.get(hdrs.ACCEPT_ENCODING))
+            if encoding is not None:
+                compressor = StreamCompressor(encoding)
+                response.headers[hdrs.CONTENT_ENCODING] = encoding
+                response.headers[hdrs.VARY] = hdrs.ACCEPT_ENCODING
         await response.prepare(request)
 
         try:
             # Send initial task state
-            task_data = task.dict()
-            await response.write(f"data: {json.dumps(task_data)}\n\n".encode("utf-8"))
+            task_data = task.model_dump(mode="json")
+            await self._write_event(response, compressor, task_data)
+
+            # Process events from the queue, sending keep-alive comments while
+            # idle and closing the stream once it has been idle for too long
+            settings = get_settings()
+            loop = asyncio.get_running_loop()
+            last_event_at = loop.time()
+            # The snapshot of a task that has already finished is the whole
+            # stream; no further events will be published for it
+            finished = task.state in TERMINAL_STATES
+            while not finished:
+                try:
+                    event = await asyncio.wait_for(
+                        sse_queue.get(), timeout=settings.sse_keepalive_interval
+                    )
+                except asyncio.TimeoutError:
+                    if loop.time() - last_event_at >= settings.sse_idle_timeout:
+                        logger.info(f"Closing idle task stream: {task_id}")
+                        break
+                    await self._write_chunk(response, compressor, b": keep-alive\n\n")
+                    continue
 
-            # Process events from the queue
-            while True:
-                event = await sse_queue.get()
                 if event is None:  # Termination signal
                     break
 
-                data = json.dumps(event)
-                await response.write(f"data: {data}\n\n".encode("utf-8"))
+                if "reconnect" in event:
+                    # Server shutdown: ask the client to resume elsewhere
+                    retry = int(settings.reconnect_delay * 1000)
+                    await self._write_chunk(
+                        response,
+                        compressor,
+                        f"event: reconnect\nretry: {retry}\n"
+                        f"data: {json.dumps(event)}\n\n".encode("utf-8"),
+                    )
+                    break
+
+                last_event_at = loop.time()
+                await self._write_event(response, compressor, event)
 
                 # If task is in a terminal state, end the stream
-                if "state" in event and event["state"] in [
-                    TaskState.COMPLETED,
-                    TaskState.CANCELED,
-                    TaskState.FAILED,
-                ]:
-                    break
+                finished = event.get("state") in TERMINAL_STATES
+
+            if compressor is not None:
+                await response.write(compressor.finish())
 
         except ConnectionResetError:
             logger.info(f"Client disconnected from task stream: {task_id}")
@@ -133,3 +251,36 @@ class TasksHandler:
             self.task_manager.remove_stream_queue(task_id)
 
         return response
+
+    async def _write_event(
+        self,
+        response: web.StreamResponse,
+        compressor: Optional[StreamCompressor],
+        event: Dict[str, Any],
+    ) -> None:
+        """Write a single SSE event, compressing and flushing it if negotiated.
+
+        Args:
+            response: The prepared streaming response
+            compressor: Stream compressor for the connection, if any
+            event: The event payload
+        """
+        chunk = f"data: {json.dumps(event)}\n\n".encode("utf-8")
+        await self._write_chunk(response, compressor, chunk)
+
+    async def _write_chunk(
+        self,
+        response: web.StreamResponse,
+        compressor: Optional[StreamCompressor],
+        chunk: bytes,
+    ) -> None:
+        """Write raw SSE bytes, compressing and flushing them if negotiated.
+
+        Args:
+            response: The prepared streaming response
+            compressor: Stream compressor for the connection, if any
+            chunk: Uncompressed SSE bytes
+        """
+        if compressor is not None:
+            chunk = compressor.compress(chunk)
+        await response.write(chunk)
@@ -0,0 +1,330 @@
+"""WebSocket transport multiplexing JSON-RPC calls and task streams."""
+
+import asyncio
+import json
+import logging
+from collections import deque
+from aiohttp import WSCloseCode, WSMsgType, web
+from typing import Any, Deque, Dict, Optional, Set, Tuple
+
+from mcp_server.api.handlers.tasks import TIMEOUT_HEADER
+from mcp_server.api.jsonrpc import (
+    INTERNAL_ERROR,
+    METHOD_NOT_FOUND,
+    MethodRegistry,
+    error_response,
+)
+from mcp_server.config import get_settings
+from mcp_server.models.request import TaskIdParams
+from mcp_server.models.task import TERMINAL_STATES
+from mcp_server.services.task_manager import TaskManager
+
+logger = logging.getLogger(__name__)
+
+
+class WebSocketConnection:
+    """Per-connection subscriptions and bounded outbound buffer.
+
+    Task events are queued here by TaskManager listeners and written by a
+    single writer coroutine, so a slow client only ever holds up its own
+    connection. A client that lets more than the configured number of bytes
+    pile up is disconnected instead of growing the buffer without bound.
+    """
+
+    def __init__(
+        self,
+        ws: web.WebSocketResponse,
+        task_manager: TaskManager,
+        max_buffered_bytes: int,
+        max_subscriptions: int,
+    ):
+        """Initialize the connection state.
+
+        Args:
+            ws: The prepared WebSocket response
+            task_manager: The task manager service
+            max_buffered_bytes: Outbound buffer size that triggers a disconnect
+            max_subscriptions: Maximum number of tasks followed at once
+        """
+        self.ws = ws
+        self.task_manager = task_manager
+        self.max_buffered_bytes = max_buffered_bytes
+        self.max_subscriptions = max_subscriptions
+        self.subscriptions: Set[str] = set()
+        self.buffered_bytes = 0
+        self._outbox: Deque[str] = deque()
+        self._outbox_ready = asyncio.Event()
+        # Close code and reason the writer closes with once the outbox drains
+        self._close_with: Optional[Tuple[int, bytes]] = None
+
+    def send(self, message: Dict[str, Any]) -> None:
+        """Queue a message for the client.
+
+        Args:
+            message: JSON-serializable message
+        """
+        if self._close_with is not None:
+            return
+
+        data = json.dumps(message)
+        if self.buffered_bytes + len(data) > self.max_buffered_bytes:
+            logger.warning(
+                "Closing WebSocket: outbound buffer exceeded "
+                f"{self.max_buffered_bytes} bytes"
+            )
+            self._outbox.clear()
+            self.buffered_bytes = 0
+            self.close_after_flush(
+                WSCloseCode.TRY_AGAIN_LATER, b"Outbound buffer limit exceeded"
+            )
+            return
+
+        self._outbox.append(data)
+        self.buffered_bytes += len(data)
+        self._outbox_ready.set()
+
+    async def run_writer(self) -> None:
+        """Write queued messages to the socket until the connection ends."""
+        while True:
+            while self._outbox:
+                data = self._outbox.popleft()
+                self.buffered_bytes -= len(data)
+                try:
+                    await self.ws.send_str(data)
+                except ConnectionResetError:
+                    return
+
+            if self._close_with is not None:
+                code, message = self._close_with
+                await self.ws.close(code=code, message=message)
+                return
+
+            self._outbox_ready.clear()
+            await self._outbox_ready.wait()
+
+    def close_after_flush(self, code: int, message: bytes) -> None:
+        """Close the socket once already queued messages have been written.
+
+        Args:
+            code: WebSocket close code
+            message: Close reason
+        """
+        if self._close_with is None:
+            self._close_with = (code, message)
+            self._outbox_ready.set()
+
+    def subscribe(self, task_id: str) -> bool:
+        """Start forwarding a task's events to this connection.
+
+        Args:
+            task_id: ID of the task to follow
+
+        Returns:
+            False if the subscription limit has been reached
+        """
+        if task_id in self.subscriptions:
+            return True
+        if len(self.subscriptions) >= self.max_subscriptions:
+            return False
+        self.subscriptions.add(task_id)
+        self.task_manager.add_listener(task_id, self.on_task_event)
+        return True
+
+    def unsubscribe(self, task_id: str) -> None:
+        """Stop forwarding a task's events to this connection.
+
+        Args:
+            task_id: ID of the followed task
+        """
+        if task_id in self.subscriptions:
+            self.subscriptions.discard(task_id)
+            self.task_manager.remove_listener(task_id, self.on_task_event)
+
+    def on_task_event(self, task_id: str, event: Dict[str, Any]) -> None:
+        """TaskManager listener forwarding an event as a JSON-RPC notification.
+
+        Args:
+            task_id: ID of the task the event belongs to
+            event: The event payload
+        """
+        self.send(
+            {
+                "jsonrpc": "2.0",
+                "method": "tasks/event",
+                "params": {"taskId": task_id, "event": event},
+            }
+        )
+        if event.get("state") in TERMINAL_STATES:
+            self.unsubscribe(task_id)
+
+    def close(self) -> None:
+        """Drop all subscriptions."""
+        for task_id in list(self.subscriptions):
+            self.unsubscribe(task_id)
+
+
+class WebSocketHandler:
+    """Handler for the multiplexed WebSocket endpoint.
+
+    Clients send JSON-RPC requests over the socket, including the
+    socket-only tasks/subscribe and tasks/unsubscribe methods, and receive
+    responses and tasks/event notifications tagged with their task ID.
+    """
+
+    def __init__(self, task_manager: TaskManager, methods: MethodRegistry):
+        """Initialize the WebSocket handler and register its JSON-RPC methods.
+
+        Args:
+            task_manager: The task manager service
+            methods: The JSON-RPC method registry
+        """
+        self.task_manager = task_manager
+        self.methods = methods
+        self.connections: Set[WebSocketConnection] = set()
+        methods.register("tasks/subscribe", TaskIdParams, self.subscribe)
+        methods.register("tasks/unsubscribe", TaskIdParams, self.unsubscribe)
+
+    async def handle_websocket(self, request: web.Request) -> web.WebSocketResponse:
+        """Serve a WebSocket connection.
+
+        Args:
+            request: The HTTP upgrade request
+
+        Returns:
+            The WebSocket response once the connection has closed
+        """
+        settings = get_settings()
+        ws = web.WebSocketResponse(
+            heartbeat=settings.ws_heartbeat,
+            max_msg_size=settings.ws_max_message_size,
+            compress=settings.compression_enabled,
+        )
+        await ws.prepare(request)
+
+        connection = WebSocketConnection(
+            ws,
+            self.task_manager,
+            settings.ws_max_buffered_bytes,
+            settings.ws_max_subscriptions,
+        )
+        writer = asyncio.create_task(connection.run_writer())
+        self.connections.add(connection)
+        context = {
+            "timeout": request.headers.get(TIMEOUT_HEADER),
+            "connection": connection,
+        }
+
+        # Stop reading once too many requests are in flight, which pushes
+        # back on the client through TCP flow control
+        inflight = asyncio.Semaphore(settings.ws_max_inflight_requests)
+        pending: Set[asyncio.Task] = set()
+
+        try:
+            async for msg in ws:
+                if msg.type == WSMsgType.ERROR:
+                    logger.warning(f"WebSocket error: {ws.exception()}")
+                    break
+                if msg.type != WSMsgType.TEXT:
+                    continue
+
+                await inflight.acquire()
+                call = asyncio.create_task(
+                    self._handle_message(connection, msg.data, context)
+                )
+                pending.add(call)
+                call.add_done_callback(pending.discard)
+                call.add_done_callback(lambda _: inflight.release())
+        finally:
+            self.connections.discard(connection)
+            connection.close()
+            for call in pending:
+                call.cancel()
+            writer.cancel()
+
+        return ws
+
+    async def on_shutdown(self, app: web.Application) -> None:
+        """Ask every connected client to reconnect to another instance.
+
+        Args:
+            app: The application being shut down
+        """
+        retry_after = get_settings().reconnect_delay
+        for connection in list(self.connections):
+            connection.send(
+                {
+                    "jsonrpc": "2.0",
+                    "method": "server/reconnect",
+                    "params": {
+                        "reason": "server shutting down",
+                        "retryAfter": retry_after,
+                    },
+                }
+            )
+            connection.close_after_flush(
+                WSCloseCode.SERVICE_RESTART, b"Server shutting down"
+            )
+
+    async def _handle_message(
+        self, connection: WebSocketConnection, raw: str, context: Dict[str, Any]
+    ) -> None:
+        """Handle one JSON-RPC message received on the socket.
+
+        Args:
+            connection: The connection the message arrived on
+            raw: The raw text frame
+            context: Transport context passed to method handlers
+        """
+        try:
+            response = await self.methods.dispatch(raw, context)
+        except Exception as e:
+            logger.error(f"Error handling WebSocket request: {e}")
+            response = error_response(None, INTERNAL_ERROR, "Internal error")
+        connection.send(response)
+
+    async def subscribe(
+        self, request_id: Any, params: TaskIdParams, context: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Handle the tasks/subscribe method.
+
+        Args:
+            request_id: JSON-RPC request ID
+            params: Validated method params
+            context: Transport context
+
+        Returns:
+            The JSON-RPC response carrying the current task snapshot
+        """
+        connection = context.get("connection")
+        if connection is None:
+            return error_response(
+                request_id, METHOD_NOT_FOUND, "Method only available over WebSocket"
+            )
+
+        task = self.task_manager.get_task(params.id)
+        if task is None:
+            return error_response(request_id, -32001, "Task not found")
+        if task.state not in TERMINAL_STATES and not connection.subscribe(task.id):
+            return error_response(request_id, -32000, "Too many subscriptions")
+        return {"id": request_id, "result": {"task": task.model_dump(mode="json")}}
+
+    async def unsubscribe(
+        self, request_id: Any, params: TaskIdParams, context: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Handle the tasks/unsubscribe method.
+
+        Args:
+            request_id: JSON-RPC request ID
+            params: Validated method params
+            context: Transport context
+
+        Returns:
+            The JSON-RPC response
+        """
+        connection = context.get("connection")
+        if connection is None:
+            return error_response(
+                request_id, METHOD_NOT_FOUND, "Method only available over WebSocket"
+            )
+        connection.unsubscribe(params.id)
+        return {"id": request_id, "result": {"ok": True}}
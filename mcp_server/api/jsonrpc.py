@@ -0,0 +1,196 @@
+"""JSON-RPC method registry with precompiled validators."""
+
+import json
+import logging
+from typing import (
+    Annotated,
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Literal,
+    Optional,
+    Type,
+    Union,
+)
+
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError, create_model
+
+logger = logging.getLogger(__name__)
+
+# Handler called with (request id, validated params, transport context)
+MethodHandler = Callable[[Any, BaseModel, Dict[str, Any]], Awaitable[Any]]
+
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+INTERNAL_ERROR = -32603
+
+
+def error_response(request_id: Any, code: int, message: str) -> Dict[str, Any]:
+    """Build a JSON-RPC error response.
+
+    Args:
+        request_id: ID of the request being answered
+        code: JSON-RPC error code
+        message: Error description
+
+    Returns:
+        The response object
+    """
+    return {
+        "jsonrpc": "2.0",
+        "id": request_id,
+        "error": {"code": code, "message": message},
+    }
+
+
+class MethodRegistry:
+    """Registry mapping JSON-RPC method names to handlers and params schemas.
+
+    Each method's request envelope is a pydantic model whose `method` field
+    is a literal, and all envelopes are combined into a single discriminated
+    union. Validation of a raw request body is therefore one pass of
+    `TypeAdapter.validate_json`, with the adapter built once rather than per
+    call. Methods may be registered at any time; the adapter is rebuilt on
+    the next dispatch.
+    """
+
+    def __init__(self):
+        """Initialize an empty method registry."""
+        self._handlers: Dict[str, MethodHandler] = {}
+        self._envelopes: Dict[str, Type[BaseModel]] = {}
+        self._adapter: Optional[TypeAdapter] = None
+
+    def register(
+        self, name: str, params_model: Type[BaseModel], handler: MethodHandler
+    ) -> None:
+        """Register a JSON-RPC method.
+
+        Args:
+            name: Method name, e.g. "tasks/send"
+            params_model: Pydantic model describing the method's params
+            handler: Coroutine function called with the validated request
+
+        Raises:
+            ValueError: If the method is already registered
+        """
+        if name in self._handlers:
+            raise ValueError(f"JSON-RPC method already registered: {name}")
+
+        # JSON-RPC allows omitting params; that is only valid if the method
+        # has no required params
+        params_default: Any = ...
+        if not any(f.is_required() for f in params_model.model_fields.values()):
+            params_default = Field(default_factory=params_model)
+        self._envelopes[name] = create_model(
+            f"{params_model.__name__}Request",
+            jsonrpc=(Literal["2.0"], "2.0"),
+            id=(Any, None),
+            method=(Literal[name], ...),
+            params=(params_model, params_default),
+        )
+        self._handlers[name] = handler
+        self._adapter = None
+        logger.debug(f"Registered JSON-RPC method: {name}")
+
+    def method(self, name: str, params_model: Type[BaseModel]):
+        """Decorator form of register().
+
+        Args:
+            name: Method name
+            params_model: Pydantic model describing the method's params
+
+        Returns:
+            Decorator registering the wrapped handler
+        """
+
+        def decorator(handler: MethodHandler) -> MethodHandler:
+            self.register(name, params_model, handler)
+            return handler
+
+        return decorator
+
+    @property
+    def methods(self) -> List[str]:
+        """Names of all registered methods."""
+        return list(self._handlers)
+
+    def build(self) -> None:
+        """Compile the request validator for all registered methods."""
+        envelopes = tuple(self._envelopes.values())
+        if not envelopes:
+            self._adapter = None
+            return
+        if len(envelopes) == 1:
+            self._adapter = TypeAdapter(envelopes[0])
+        else:
+            self._adapter = TypeAdapter(
+                Annotated[Union[envelopes], Field(discriminator="method")]
+            )
+
+    async def dispatch(
+        self, raw: Union[bytes, str], context: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Validate a raw JSON-RPC request and call its handler.
+
+        Args:
+            raw: The undecoded request body
+            context: Transport-specific values passed through to the handler
+
+        Returns:
+            The JSON-RPC response object
+        """
+        if self._adapter is None:
+            self.build()
+        if self._adapter is None:
+            return error_response(None, METHOD_NOT_FOUND, "No methods registered")
+
+        try:
+            request = self._adapter.validate_json(raw)
+        except ValidationError as e:
+            return self._validation_error(raw, e)
+
+        try:
+            result = await self._handlers[request.method](
+                request.id, request.params, context or {}
+            )
+        except Exception as e:
+            logger.error(f"Error handling JSON-RPC method {request.method}: {e}")
+            return error_response(request.id, INTERNAL_ERROR, "Internal error")
+
+        if isinstance(result, BaseModel):
+            result = result.model_dump()
+        return {"jsonrpc": "2.0", **result}
+
+    def _validation_error(
+        self, raw: Union[bytes, str], error: ValidationError
+    ) -> Dict[str, Any]:
+        """Map a validation failure to the matching JSON-RPC error."""
+        first = error.errors()[0]
+        if first["type"] == "json_invalid":
+            return error_response(None, PARSE_ERROR, "Parse error")
+
+        # Only decode the body again on this slow path, to recover the id
+        try:
+            data = json.loads(raw)
+        except ValueError:
+            data = None
+        if not isinstance(data, dict):
+            return error_response(None, INVALID_REQUEST, "Invalid Request")
+
+        request_id = data.get("id")
+        method = data.get("method")
+        if first["type"] == "union_tag_invalid" or (
+            isinstance(method, str) and method not in self._handlers
+        ):
+            return error_response(
+                request_id, METHOD_NOT_FOUND, f"Method {method} not found"
+            )
+        if "params" in first["loc"]:
+            return error_response(
+                request_id, INVALID_PARAMS, f"Invalid params: {first['msg']}"
+            )
+        return error_response(request_id, INVALID_REQUEST, "Invalid Request")
@@ -6,7 +6,10 @@ from aiohttp import web
 from mcp_server.api.handlers.tasks import TasksHandler
 from mcp_server.api.handlers.agents import AgentsHandler
 from mcp_server.api.handlers.claude import ClaudeHandler
-from mcp_server.api.handlers.health import health_check
+from mcp_server.api.handlers.health import health_check, readiness_check
+from mcp_server.api.handlers.websocket import WebSocketHandler
+from mcp_server.config import get_settings
+from mcp_server.startup import lazy_import
 
 logger = logging.getLogger(__name__)
 
@@ -14,13 +17,14 @@ logger = logging.getLogger(__name__)
 def setup_routes(app: web.Application) -> None:
     """Set up routes for the application."""
     # Create handlers
-    tasks_handler = TasksHandler(app["task_manager"])
+    tasks_handler = TasksHandler(app["task_manager"], app["jsonrpc_methods"])
     agents_handler = AgentsHandler(app["agent_registry"])
     claude_handler = ClaudeHandler(app["task_manager"])
+    websocket_handler = WebSocketHandler(app["task_manager"], app["jsonrpc_methods"])
 
     # Health check
     app.router.add_get("/health", health_check)
-    app.router.add_get("/ready", health_check)
+    app.router.add_get("/ready", readiness_check)
 
     # A2A JSON-RPC endpoint
     app.router.add_post("/", tasks_handler.handle_jsonrpc)
@@ -28,6 +32,10 @@ def setup_routes(app: web.Application) -> None:
     # Tasks streaming endpoint
     app.router.add_get("/tasks/{task_id}/stream", tasks_handler.stream_task)
 
+    # Multiplexed JSON-RPC and task streams over a single WebSocket
+    app.router.add_get("/ws", websocket_handler.handle_websocket)
+    app.on_shutdown.append(websocket_handler.on_shutdown)
+
     # Agent discovery endpoints
     app.router.add_get("/agents", agents_handler.list_agents)
     app.router.add_get("/agents/{agent_id}", agents_handler.get_agent)
@@ -36,4 +44,26 @@ def setup_routes(app: web.Application) -> None:
     # Claude integration endpoints
     app.router.add_post("/claude", claude_handler.handle_claude_request)
 
+    # Delayed, recurring and batch tasks
+    if app["scheduler"] is not None:
+        scheduler = lazy_import("mcp_server.api.handlers.scheduler")
+        scheduler.SchedulerHandler(app["scheduler"], app["jsonrpc_methods"])
+
+    # Admin diagnostics endpoints, only ever served behind the admin token
+    if app["diagnostics"] is not None and not get_settings().admin_token:
+        logger.warning(
+            "Diagnostics enabled without MCP_ADMIN_TOKEN; "
+            "admin endpoints are not served"
+        )
+    elif app["diagnostics"] is not None:
+        diagnostics = lazy_import("mcp_server.api.handlers.diagnostics")
+        diagnostics_handler = diagnostics.DiagnosticsHandler(app["diagnostics"])
+        app.router.add_get("/admin/diagnostics", diagnostics_handler.get_diagnostics)
+        app.router.add_get(
+            "/admin/diagnostics/profile", diagnostics_handler.get_profile
+        )
+        app.router.add_post(
+            "/admin/diagnostics/profile", diagnostics_handler.start_profile
+        )
+
     logger.info("Routes configured")
\ No newline at end of file
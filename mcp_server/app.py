@@ -1,19 +1,132 @@
 """Main application factory for the MCP server."""
 
+import asyncio
 import logging
 from aiohttp import web
 
 from mcp_server.config import get_settings
+from mcp_server.api.jsonrpc import MethodRegistry
 from mcp_server.api.routes import setup_routes
 from mcp_server.middleware import setup_middleware
 from mcp_server.services.task_manager import TaskManager
 from mcp_server.services.agent_registry import AgentCardRegistry
+from mcp_server.services.readiness import ReadinessState
+from mcp_server.services.task_handlers import EchoHandler, HandlerRegistry
+from mcp_server.startup import get_startup_timer, lazy_import
 
 logger = logging.getLogger(__name__)
 
 
+async def _start_push_sender(app: web.Application) -> None:
+    """Open the push notification connection pool."""
+    await app["push_sender"].start()
+
+
+async def _close_push_sender(app: web.Application) -> None:
+    """Flush pending push notifications and close the connection pool."""
+    await app["push_sender"].close()
+
+
+async def _start_scheduler(app: web.Application) -> None:
+    """Load the persisted schedule and start dispatching."""
+    await app["scheduler"].start()
+
+
+async def _close_scheduler(app: web.Application) -> None:
+    """Stop dispatching and persist the schedule."""
+    await app["scheduler"].close()
+
+
+async def _start_diagnostics(app: web.Application) -> None:
+    """Start event-loop lag monitoring."""
+    await app["diagnostics"].start()
+
+
+async def _stop_diagnostics(app: web.Application) -> None:
+    """Stop event-loop lag monitoring."""
+    await app["diagnostics"].stop()
+
+
+async def _build_jsonrpc_methods(app: web.Application) -> None:
+    """Compile JSON-RPC validators once all methods are registered."""
+    app["jsonrpc_methods"].build()
+
+
+async def _warm_up(app: web.Application) -> None:
+    """Replay persisted state, then report the server as ready."""
+    timer = get_startup_timer()
+    try:
+        # The JSON-RPC validators were already built by the startup hook
+        await app["task_manager"].restore()
+        timer.mark("persistence replayed")
+        app["readiness"].mark_ready()
+    except Exception as e:
+        logger.exception(f"Startup warmup failed: {e}")
+        app["readiness"].mark_not_ready("warmup failed")
+
+
+async def _start_warm_up(app: web.Application) -> None:
+    """Run warmup in the background so the server can listen immediately.
+
+    /health answers as soon as the socket is open; /ready stays red until
+    warmup finishes.
+    """
+    app["warm_up_task"] = asyncio.create_task(_warm_up(app))
+
+
+async def _cancel_warm_up(app: web.Application) -> None:
+    """Stop warmup if the server shuts down before it finished."""
+    app["warm_up_task"].cancel()
+
+
+async def _start_task_eviction(app: web.Application) -> None:
+    """Periodically drop finished tasks past the retention period."""
+    app["task_eviction"] = asyncio.create_task(
+        app["task_manager"].run_eviction(get_settings().task_eviction_interval)
+    )
+
+
+async def _stop_task_eviction(app: web.Application) -> None:
+    """Stop the task eviction loop."""
+    app["task_eviction"].cancel()
+
+
+async def _close_task_streams(app: web.Application) -> None:
+    """Send open task streams a final event asking clients to reconnect."""
+    app["task_manager"].close_streams()
+
+
+async def shutdown_gracefully(app: web.Application, site: web.BaseSite) -> None:
+    """Take the server out of rotation and drain or checkpoint its tasks.
+
+    Readiness turns red first, so load balancers stop routing to this
+    instance, and new tasks are rejected. After the grace period the
+    listening socket is closed, letting a replacement bound with
+    SO_REUSEPORT take new connections, and running tasks get the shutdown
+    timeout to finish before they are checkpointed. Open streams are told
+    to reconnect by the on_shutdown hooks that run in runner.cleanup().
+
+    Args:
+        app: The running application
+        site: The site accepting connections
+    """
+    settings = get_settings()
+    app["readiness"].mark_not_ready("shutting down")
+    app["task_manager"].accepting = False
+    if settings.shutdown_grace_period > 0:
+        await asyncio.sleep(settings.shutdown_grace_period)
+    await site.stop()
+
+    interrupted = await app["task_manager"].shutdown(settings.shutdown_timeout)
+    if interrupted:
+        logger.info(f"{len(interrupted)} task(s) will resume after restart")
+
+
 async def create_app() -> web.Application:
-    """Create and configure the aiohttp application."""
+    """Create and configure the aiohttp application.
+
+    Optional subsystems are only imported when their settings enable them.
+    """
     settings = get_settings()
     app = web.Application()
 
@@ -21,12 +134,84 @@ async def create_app() -> web.Application:
     setup_middleware(app)
 
     # Initialize services
-    task_manager = TaskManager()
+    persistence_layer = None
+    if settings.persistence_enabled:
+        persistence = lazy_import("mcp_server.services.persistence")
+        persistence_layer = persistence.FilePersistenceLayer(settings.storage_path)
+
+    push_sender = None
+    if settings.push_notifications_enabled and not settings.push_signing_secret:
+        # Unsigned deliveries could not be told apart from forged ones
+        logger.warning(
+            "Push notifications disabled: MCP_PUSH_SIGNING_SECRET is not set"
+        )
+    elif settings.push_notifications_enabled:
+        push_notifications = lazy_import("mcp_server.services.push_notifications")
+        push_sender = push_notifications.PushNotificationSender(
+            signing_secret=settings.push_signing_secret,
+            batch_window=settings.push_batch_window,
+            max_batch_size=settings.push_max_batch_size,
+            request_timeout=settings.push_request_timeout,
+            max_retries=settings.push_max_retries,
+            retry_base_delay=settings.push_retry_base_delay,
+            retry_queue_size=settings.push_retry_queue_size,
+            pool_size=settings.push_pool_size,
+            policy=push_notifications.DestinationPolicy(
+                settings.push_allowed_networks.split(",")
+            ),
+            persistence_layer=persistence_layer,
+        )
+        app.on_startup.append(_start_push_sender)
+        app.on_cleanup.append(_close_push_sender)
+
+    # Task handlers; plugins register theirs by skill or agent ID
+    task_handlers = HandlerRegistry(default=EchoHandler())
+    task_manager = TaskManager(
+        persistence_layer=persistence_layer,
+        push_sender=push_sender,
+        handlers=task_handlers,
+    )
     agent_registry = AgentCardRegistry()
 
+    scheduler = None
+    if settings.scheduler_enabled:
+        scheduler = lazy_import("mcp_server.services.scheduler").TaskScheduler(
+            task_manager,
+            concurrency=settings.scheduler_concurrency,
+            persistence_layer=persistence_layer,
+        )
+        app.on_startup.append(_start_scheduler)
+        app.on_cleanup.append(_close_scheduler)
+
+    diagnostics = None
+    if settings.diagnostics_enabled:
+        diagnostics = lazy_import("mcp_server.services.diagnostics").LoopDiagnostics(
+            interval=settings.loop_lag_interval,
+            slow_threshold=settings.slow_callback_threshold,
+        )
+        app.on_startup.append(_start_diagnostics)
+        app.on_cleanup.append(_stop_diagnostics)
+
     # Store services in app context
     app["task_manager"] = task_manager
+    app["task_handlers"] = task_handlers
     app["agent_registry"] = agent_registry
+    app["persistence_layer"] = persistence_layer
+    app["push_sender"] = push_sender
+    app["scheduler"] = scheduler
+    app["diagnostics"] = diagnostics
+    app["readiness"] = ReadinessState()
+
+    # JSON-RPC methods; plugins may register more before the app starts
+    app["jsonrpc_methods"] = MethodRegistry()
+    app.on_startup.append(_build_jsonrpc_methods)
+
+    # Readiness goes green once replay and warmup have finished
+    app.on_startup.append(_start_warm_up)
+    app.on_cleanup.append(_cancel_warm_up)
+    app.on_shutdown.append(_close_task_streams)
+    app.on_startup.append(_start_task_eviction)
+    app.on_cleanup.append(_stop_task_eviction)
 
     # Set up routes
     setup_routes(app)
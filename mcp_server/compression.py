@@ -0,0 +1,156 @@
+"""Response compression helpers for the MCP server."""
+
+import asyncio
+import gzip
+import zlib
+from typing import Callable, Dict, List, Optional
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+
+
+# Preferred order when the client gives several encodings the same weight
+SUPPORTED_ENCODINGS: List[str] = [
+    name
+    for name, available in (
+        ("zstd", zstandard is not None),
+        ("br", brotli is not None),
+        ("gzip", True),
+    )
+    if available
+]
+
+
+def negotiate_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    """Pick the best supported content coding for an Accept-Encoding header.
+
+    Args:
+        accept_encoding: The raw Accept-Encoding header value
+
+    Returns:
+        The chosen encoding name, or None if the body should not be compressed
+    """
+    if not accept_encoding:
+        return None
+
+    weights: Dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        name, _, params = item.strip().partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        weights[name] = quality
+
+    best = None
+    best_quality = 0.0
+    for encoding in SUPPORTED_ENCODINGS:
+        quality = weights.get(encoding, weights.get("*", 0.0))
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    """Compress a complete response body.
+
+    Args:
+        body: The uncompressed body
+        encoding: A name from SUPPORTED_ENCODINGS
+
+    Returns:
+        The compressed body
+    """
+    if encoding == "gzip":
+        return gzip.compress(body, compresslevel=6)
+    if encoding == "br":
+        return brotli.compress(body, quality=5)
+    if encoding == "zstd":
+        return zstandard.ZstdCompressor(level=3).compress(body)
+    raise ValueError(f"Unsupported encoding: {encoding}")
+
+
+async def compress_async(body: bytes, encoding: str, threaded_threshold: int) -> bytes:
+    """Compress a body, offloading large ones to the default thread pool.
+
+    Args:
+        body: The uncompressed body
+        encoding: A name from SUPPORTED_ENCODINGS
+        threaded_threshold: Bodies at least this large are compressed off-loop
+
+    Returns:
+        The compressed body
+    """
+    if len(body) < threaded_threshold:
+        return compress(body, encoding)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, compress, body, encoding)
+
+
+class StreamCompressor:
+    """Incremental compressor that flushes after every chunk.
+
+    Used for Server-Sent Events so each event reaches the client as soon as
+    it is written instead of waiting for the compressor's internal buffer.
+    """
+
+    def __init__(self, encoding: str):
+        """Initialize the stream compressor.
+
+        Args:
+            encoding: A name from SUPPORTED_ENCODINGS
+        """
+        self.encoding = encoding
+        self._compress: Callable[[bytes], bytes]
+        self._flush: Callable[[], bytes]
+        self._finish: Callable[[], bytes]
+
+        if encoding == "gzip":
+            obj = zlib.compressobj(6, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+            self._compress = obj.compress
+            self._flush = lambda: obj.flush(zlib.Z_SYNC_FLUSH)
+            self._finish = obj.flush
+        elif encoding == "br":
+            obj = brotli.Compressor(quality=5)
+            self._compress = obj.process
+            self._flush = obj.flush
+            self._finish = obj.finish
+        elif encoding == "zstd":
+            obj = zstandard.ZstdCompressor(level=3).compressobj()
+            self._compress = obj.compress
+            self._flush = lambda: obj.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+            self._finish = obj.flush
+        else:
+            raise ValueError(f"Unsupported encoding: {encoding}")
+
+    def compress(self, chunk: bytes) -> bytes:
+        """Compress a chunk and flush it so it can be decoded immediately.
+
+        Args:
+            chunk: Uncompressed bytes
+
+        Returns:
+            Compressed bytes ready to write to the wire
+        """
+        return self._compress(chunk) + self._flush()
+
+    def finish(self) -> bytes:
+        """Terminate the compressed stream.
+
+        Returns:
+            Any trailing compressed bytes
+        """
+        return self._finish()
@@ -13,6 +13,50 @@ class Settings(BaseModel):
     port: int = int(os.getenv("MCP_PORT", "8080"))
     debug: bool = os.getenv("MCP_DEBUG", "False").lower() == "true"
 
+    # HTTP connection tuning
+    keepalive_timeout: float = float(os.getenv("MCP_KEEPALIVE_TIMEOUT", "75"))
+    listen_backlog: int = int(os.getenv("MCP_LISTEN_BACKLOG", "1024"))
+    reuse_port: bool = os.getenv("MCP_REUSE_PORT", "False").lower() == "true"
+
+    # Response compression
+    compression_enabled: bool = (
+        os.getenv("MCP_COMPRESSION_ENABLED", "True").lower() == "true"
+    )
+    compression_min_size: int = int(os.getenv("MCP_COMPRESSION_MIN_SIZE", "1024"))
+    compression_threaded_min_size: int = int(
+        os.getenv("MCP_COMPRESSION_THREADED_MIN_SIZE", "65536")
+    )
+
+    # Deadlines and stream lifetimes
+    task_default_timeout: float = float(os.getenv("MCP_TASK_DEFAULT_TIMEOUT", "300"))
+    task_max_timeout: float = float(os.getenv("MCP_TASK_MAX_TIMEOUT", "3600"))
+    sse_keepalive_interval: float = float(os.getenv("MCP_SSE_KEEPALIVE_INTERVAL", "15"))
+    sse_idle_timeout: float = float(os.getenv("MCP_SSE_IDLE_TIMEOUT", "300"))
+
+    # Graceful shutdown
+    shutdown_grace_period: float = float(os.getenv("MCP_SHUTDOWN_GRACE_PERIOD", "0"))
+    shutdown_timeout: float = float(os.getenv("MCP_SHUTDOWN_TIMEOUT", "30"))
+    reconnect_delay: float = float(os.getenv("MCP_RECONNECT_DELAY", "1"))
+
+    # Task retention; 0 keeps finished tasks forever
+    task_retention_seconds: float = float(
+        os.getenv("MCP_TASK_RETENTION_SECONDS", "86400")
+    )
+    task_eviction_interval: float = float(os.getenv("MCP_TASK_EVICTION_INTERVAL", "60"))
+
+    # Scheduler for delayed, recurring and batch tasks
+    scheduler_enabled: bool = (
+        os.getenv("MCP_SCHEDULER_ENABLED", "True").lower() == "true"
+    )
+    scheduler_concurrency: int = int(os.getenv("MCP_SCHEDULER_CONCURRENCY", "4"))
+
+    # WebSocket transport
+    ws_heartbeat: float = float(os.getenv("MCP_WS_HEARTBEAT", "30"))
+    ws_max_message_size: int = int(os.getenv("MCP_WS_MAX_MESSAGE_SIZE", "1048576"))
+    ws_max_buffered_bytes: int = int(os.getenv("MCP_WS_MAX_BUFFERED_BYTES", "4194304"))
+    ws_max_inflight_requests: int = int(os.getenv("MCP_WS_MAX_INFLIGHT_REQUESTS", "32"))
+    ws_max_subscriptions: int = int(os.getenv("MCP_WS_MAX_SUBSCRIPTIONS", "10000"))
+
     # Authentication
     auth_enabled: bool = os.getenv("MCP_AUTH_ENABLED", "False").lower() == "true"
     jwt_secret: str = os.getenv("MCP_JWT_SECRET", "")
@@ -25,6 +69,32 @@ class Settings(BaseModel):
     )
     storage_path: str = os.getenv("MCP_STORAGE_PATH", "./data")
 
+    # Push notifications
+    push_notifications_enabled: bool = (
+        os.getenv("MCP_PUSH_NOTIFICATIONS_ENABLED", "True").lower() == "true"
+    )
+    push_signing_secret: str = os.getenv("MCP_PUSH_SIGNING_SECRET", "")
+    push_batch_window: float = float(os.getenv("MCP_PUSH_BATCH_WINDOW", "0.05"))
+    push_max_batch_size: int = int(os.getenv("MCP_PUSH_MAX_BATCH_SIZE", "100"))
+    push_request_timeout: float = float(os.getenv("MCP_PUSH_REQUEST_TIMEOUT", "10"))
+    push_max_retries: int = int(os.getenv("MCP_PUSH_MAX_RETRIES", "8"))
+    push_retry_base_delay: float = float(os.getenv("MCP_PUSH_RETRY_BASE_DELAY", "1"))
+    push_retry_queue_size: int = int(os.getenv("MCP_PUSH_RETRY_QUEUE_SIZE", "1000"))
+    push_pool_size: int = int(os.getenv("MCP_PUSH_POOL_SIZE", "100"))
+    # Comma-separated CIDR networks webhooks may use besides global addresses
+    push_allowed_networks: str = os.getenv("MCP_PUSH_ALLOWED_NETWORKS", "")
+
+    # Diagnostics
+    diagnostics_enabled: bool = (
+        os.getenv("MCP_DIAGNOSTICS_ENABLED", "False").lower() == "true"
+    )
+    loop_lag_interval: float = float(os.getenv("MCP_LOOP_LAG_INTERVAL", "0.1"))
+    slow_callback_threshold: float = float(
+        os.getenv("MCP_SLOW_CALLBACK_THRESHOLD", "0.1")
+    )
+    profile_max_duration: float = float(os.getenv("MCP_PROFILE_MAX_DURATION", "60"))
+    admin_token: str = os.getenv("MCP_ADMIN_TOKEN", "")
+
     # Monitoring
     telemetry_enabled: bool = (
         os.getenv("MCP_TELEMETRY_ENABLED", "False").lower() == "true"
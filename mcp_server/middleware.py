@@ -2,7 +2,11 @@
 
 import logging
 import time
-from aiohttp import web
+from aiohttp import hdrs, web
+
+from mcp_server.compression import compress_async, negotiate_encoding
+from mcp_server.config import get_settings
+from mcp_server.services.task_labels import track
 
 logger = logging.getLogger(__name__)
 
@@ -51,11 +55,70 @@ async def logging_middleware(request: web.Request, handler) -> web.Response:
     return response
 
 
+@web.middleware
+async def compression_middleware(request: web.Request, handler) -> web.Response:
+    """Compress JSON responses when the client supports it.
+
+    Only complete JSON bodies above the configured size are compressed;
+    streaming responses handle their own encoding.
+
+    Args:
+        request: The HTTP request object
+        handler: The request handler function
+
+    Returns:
+        The handler's response, compressed if applicable
+    """
+    response = await handler(request)
+
+    if not isinstance(response, web.Response) or response.prepared:
+        return response
+    if hdrs.CONTENT_ENCODING in response.headers:
+        return response
+    if response.content_type != "application/json":
+        return response
+
+    body = response.body
+    settings = get_settings()
+    if not isinstance(body, bytes) or len(body) < settings.compression_min_size:
+        return response
+
+    encoding = negotiate_encoding(request.headers.get(hdrs.ACCEPT_ENCODING))
+    if encoding is None:
+        return response
+
+    response.body = await compress_async(
+        body, encoding, settings.compression_threaded_min_size
+    )
+    response.headers[hdrs.CONTENT_ENCODING] = encoding
+    response.headers.add(hdrs.VARY, hdrs.ACCEPT_ENCODING)
+    return response
+
+
+@web.middleware
+async def diagnostics_middleware(request: web.Request, handler) -> web.Response:
+    """Label the request's task so loop stalls can be attributed to it.
+
+    Args:
+        request: The HTTP request object
+        handler: The request handler function
+
+    Returns:
+        The handler's response
+    """
+    with track(f"{request.method} {request.path}"):
+        return await handler(request)
+
+
 def setup_middleware(app: web.Application) -> None:
     """Set up middleware for the application.
 
     Args:
         app: The web application
     """
+    if get_settings().compression_enabled:
+        app.middlewares.append(compression_middleware)
     app.middlewares.append(error_middleware)
     app.middlewares.append(logging_middleware)
+    if get_settings().diagnostics_enabled:
+        app.middlewares.append(diagnostics_middleware)
@@ -1,7 +1,10 @@
 """Request models for the MCP server."""
 
+from datetime import datetime
 from typing import Dict, Any, Optional
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, Field
+
+from mcp_server.models.task import Message, PushNotificationConfig, TaskState
 
 
 class JsonRpcRequest(BaseModel):
@@ -25,3 +28,42 @@ class SubscribeTaskRequest(BaseModel):
 
     id: Any
     params: Dict[str, Any]
+
+
+class TaskSendParams(BaseModel):
+    """Params for the tasks/send and tasks/sendSubscribe methods."""
+
+    # Keep unknown A2A fields (e.g. metadata) for handlers that use them
+    model_config = ConfigDict(extra="allow")
+
+    id: str
+    sessionId: Optional[str] = None
+    message: Message
+    timeout: Optional[float] = Field(default=None, gt=0, allow_inf_nan=False)
+    pushNotification: Optional[PushNotificationConfig] = None
+    skill: Optional[str] = None
+    agentId: Optional[str] = None
+
+
+class TaskIdParams(BaseModel):
+    """Params for methods addressing an existing task by ID."""
+
+    id: str
+
+
+class TaskScheduleParams(TaskSendParams):
+    """Params for the tasks/schedule method."""
+
+    runAt: Optional[datetime] = None
+    interval: Optional[float] = Field(default=None, gt=0, allow_inf_nan=False)
+    priority: int = 0
+
+
+class TaskListParams(BaseModel):
+    """Params for the tasks/list method."""
+
+    sessionId: Optional[str] = None
+    state: Optional[TaskState] = None
+    updatedAfter: Optional[datetime] = None
+    limit: int = Field(default=50, ge=1, le=500)
+    cursor: Optional[str] = None
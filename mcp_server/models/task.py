@@ -3,7 +3,7 @@
 from enum import Enum
 from typing import List, Dict, Any, Optional
 from datetime import datetime
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 
 class TaskState(str, Enum):
@@ -16,6 +16,10 @@ class TaskState(str, Enum):
     CANCELED = "canceled"
 
 
+# States a task never leaves once it has reached them
+TERMINAL_STATES = frozenset({TaskState.COMPLETED, TaskState.FAILED, TaskState.CANCELED})
+
+
 class Part(BaseModel):
     """Message part model."""
 
@@ -32,6 +36,15 @@ class Message(BaseModel):
     parts: List[Dict[str, Any]]
 
 
+class PushNotificationConfig(BaseModel):
+    """Client-provided webhook for task state change notifications."""
+
+    url: str
+    # Secret of the client's webhook; never sent back to API clients and
+    # only written by the persistence layer
+    token: Optional[str] = Field(default=None, exclude=True)
+
+
 class Task(BaseModel):
     """Task model representing a unit of work."""
 
@@ -42,3 +55,7 @@ class Task(BaseModel):
     created_at: datetime
     updated_at: datetime
     error: Optional[str] = None
+    push_notification: Optional[PushNotificationConfig] = None
+    # Routing of the task to a handler; see HandlerRegistry
+    skill: Optional[str] = None
+    agent_id: Optional[str] = None
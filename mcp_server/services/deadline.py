@@ -0,0 +1,93 @@
+"""Deadline propagation for request and task execution."""
+
+import math
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Iterator, Optional
+
+_current_deadline: ContextVar[Optional["Deadline"]] = ContextVar(
+    "mcp_deadline", default=None
+)
+
+
+class Deadline:
+    """Absolute point in time by which a unit of work must finish."""
+
+    def __init__(self, timeout: float):
+        """Initialize the deadline.
+
+        Args:
+            timeout: Seconds from now until the deadline expires
+        """
+        self.timeout = timeout
+        self.expires_at = time.monotonic() + timeout
+
+    def remaining(self) -> float:
+        """Return the number of seconds left before expiry (never negative)."""
+        return max(0.0, self.expires_at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        """Whether the deadline has passed."""
+        return time.monotonic() >= self.expires_at
+
+
+def resolve_timeout(requested: Any, default: float, maximum: float) -> float:
+    """Turn a client-supplied timeout into an effective one.
+
+    Args:
+        requested: Timeout in seconds from a header or JSON-RPC param, if any
+        default: Timeout used when the client does not supply a valid one
+        maximum: Server-side upper bound
+
+    Returns:
+        The timeout in seconds, clamped to the server maximum
+    """
+    try:
+        timeout = float(requested)
+    except (TypeError, ValueError):
+        timeout = default
+    # NaN fails every comparison and would otherwise get through
+    if not math.isfinite(timeout) or timeout <= 0:
+        timeout = default
+    return min(timeout, maximum)
+
+
+def current_deadline() -> Optional[Deadline]:
+    """Return the deadline bound to the current context, if any."""
+    return _current_deadline.get()
+
+
+def remaining_timeout(default: Optional[float] = None) -> Optional[float]:
+    """Return the timeout to use for an outbound call from the current context.
+
+    Args:
+        default: The call's own timeout, if it has one
+
+    Returns:
+        The smaller of the default and the time left on the current deadline
+    """
+    deadline = _current_deadline.get()
+    if deadline is None:
+        return default
+    if default is None:
+        return deadline.remaining()
+    return min(default, deadline.remaining())
+
+
+@contextmanager
+def deadline_scope(deadline: Deadline) -> Iterator[Deadline]:
+    """Bind a deadline to the current context for the duration of a block.
+
+    Args:
+        deadline: The deadline to propagate
+
+    Yields:
+        The bound deadline
+    """
+    token = _current_deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current_deadline.reset(token)
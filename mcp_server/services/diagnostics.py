@@ -0,0 +1,235 @@
+"""Event-loop lag monitoring and sampling profiler."""
+
+import asyncio
+import logging
+import sys
+import threading
+import time
+from collections import Counter, deque
+from datetime import datetime
+from typing import Any, Deque, Dict, List, Optional
+
+from mcp_server.services.task_labels import disable_labels, enable_labels, get_label
+
+logger = logging.getLogger(__name__)
+
+
+def _format_stack(frame, limit: int = 40) -> List[str]:
+    """Render a frame's call stack, innermost call last."""
+    stack = []
+    while frame is not None and len(stack) < limit:
+        code = frame.f_code
+        stack.append(f"{code.co_filename}:{frame.f_lineno} in {code.co_name}")
+        frame = frame.f_back
+    stack.reverse()
+    return stack
+
+
+def _collapse_stack(frame) -> str:
+    """Render a frame's call stack in collapsed (flame graph) form."""
+    names = []
+    while frame is not None:
+        code = frame.f_code
+        names.append(f"{code.co_filename}:{code.co_name}")
+        frame = frame.f_back
+    names.reverse()
+    return ";".join(names)
+
+
+class LoopDiagnostics:
+    """Measures event-loop lag and records what blocked the loop.
+
+    A coroutine on the loop wakes every `interval` seconds and records how
+    late it was scheduled. A watchdog thread checks that heartbeat; if the
+    loop has not ticked for longer than `slow_threshold` it captures the
+    loop thread's current stack, which is the code blocking the loop. The
+    steady-state cost is one timer callback per interval and one thread
+    wakeup per half threshold.
+    """
+
+    def __init__(
+        self,
+        interval: float = 0.1,
+        slow_threshold: float = 0.1,
+        max_records: int = 100,
+        window: int = 600,
+    ):
+        """Initialize loop diagnostics.
+
+        Args:
+            interval: Seconds between lag measurements
+            slow_threshold: Stall duration that gets recorded with its stack
+            max_records: Number of slow callbacks and profiles kept
+            window: Number of recent lag samples used for statistics
+        """
+        self.interval = interval
+        self.slow_threshold = slow_threshold
+        self.lag_samples: Deque[float] = deque(maxlen=window)
+        self.max_lag = 0.0
+        self.slow_callbacks: Deque[Dict[str, Any]] = deque(maxlen=max_records)
+        self.last_profile: Optional[Dict[str, Any]] = None
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread_id: Optional[int] = None
+        self._heartbeat = time.monotonic()
+        self._stall: Optional[Dict[str, Any]] = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._monitor_task: Optional[asyncio.Task] = None
+        self._watchdog: Optional[threading.Thread] = None
+        self._profiler: Optional[threading.Thread] = None
+
+    async def start(self) -> None:
+        """Start the lag monitor and watchdog for the running loop."""
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._heartbeat = time.monotonic()
+        self._stop.clear()
+        enable_labels()
+
+        self._monitor_task = asyncio.create_task(self._monitor())
+        self._watchdog = threading.Thread(
+            target=self._watch, name="loop-watchdog", daemon=True
+        )
+        self._watchdog.start()
+        logger.info("Event-loop diagnostics started")
+
+    async def stop(self) -> None:
+        """Stop monitoring."""
+        disable_labels()
+        self._stop.set()
+        if self._monitor_task is not None:
+            self._monitor_task.cancel()
+            try:
+                await self._monitor_task
+            except asyncio.CancelledError:
+                pass
+            self._monitor_task = None
+
+    def start_profile(self, duration: float, sample_interval: float = 0.005) -> bool:
+        """Sample the loop thread's stack for a time window.
+
+        Args:
+            duration: Seconds to sample for
+            sample_interval: Seconds between samples
+
+        Returns:
+            False if a profile is already running
+        """
+        if self._profiler is not None and self._profiler.is_alive():
+            return False
+        self._profiler = threading.Thread(
+            target=self._profile,
+            args=(duration, sample_interval),
+            name="loop-profiler",
+            daemon=True,
+        )
+        self._profiler.start()
+        return True
+
+    @property
+    def profiling(self) -> bool:
+        """Whether a profile is currently being collected."""
+        return self._profiler is not None and self._profiler.is_alive()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return lag statistics and recorded slow callbacks.
+
+        Returns:
+            JSON-serializable diagnostics report
+        """
+        samples = sorted(self.lag_samples)
+        lag: Dict[str, Any] = {"samples": len(samples), "max": self.max_lag}
+        if samples:
+            lag.update(
+                {
+                    "last": self.lag_samples[-1],
+                    "mean": sum(samples) / len(samples),
+                    "p50": samples[len(samples) // 2],
+                    "p99": samples[min(len(samples) - 1, int(len(samples) * 0.99))],
+                }
+            )
+
+        with self._lock:
+            slow_callbacks = list(self.slow_callbacks)
+
+        return {
+            "interval": self.interval,
+            "slowThreshold": self.slow_threshold,
+            "lag": lag,
+            "slowCallbacks": slow_callbacks,
+            "profiling": self.profiling,
+        }
+
+    async def _monitor(self) -> None:
+        """Measure how late the loop wakes up a sleeping coroutine."""
+        loop = asyncio.get_running_loop()
+        while True:
+            started = loop.time()
+            await asyncio.sleep(self.interval)
+            lag = max(0.0, loop.time() - started - self.interval)
+            self._heartbeat = time.monotonic()
+
+            self.lag_samples.append(lag)
+            if lag > self.max_lag:
+                self.max_lag = lag
+
+            with self._lock:
+                stall, self._stall = self._stall, None
+                if stall is not None:
+                    stall["duration"] = lag
+                    self.slow_callbacks.append(stall)
+            if stall is not None:
+                logger.warning(
+                    f"Event loop blocked for {lag:.3f}s"
+                    + (f" by {stall['context']}" if stall["context"] else "")
+                )
+
+    def _watch(self) -> None:
+        """Watchdog thread capturing the stack of a stalled loop."""
+        check_interval = self.slow_threshold / 2
+        while not self._stop.wait(check_interval):
+            stalled_for = time.monotonic() - self._heartbeat - self.interval
+            if stalled_for < self.slow_threshold:
+                continue
+            with self._lock:
+                if self._stall is not None:
+                    continue
+            frame = sys._current_frames().get(self._loop_thread_id)
+            if frame is None:
+                continue
+
+            current = asyncio.current_task(self._loop)
+            stall = {
+                "detectedAt": datetime.utcnow().isoformat(),
+                "duration": None,
+                "context": get_label(current),
+                "task": current.get_name() if current is not None else None,
+                "stack": _format_stack(frame),
+            }
+            with self._lock:
+                self._stall = stall
+
+    def _profile(self, duration: float, sample_interval: float) -> None:
+        """Profiler thread aggregating sampled loop-thread stacks."""
+        started_at = datetime.utcnow().isoformat()
+        end = time.monotonic() + duration
+        stacks: Counter = Counter()
+        samples = 0
+        while time.monotonic() < end and not self._stop.is_set():
+            frame = sys._current_frames().get(self._loop_thread_id)
+            if frame is not None:
+                stacks[_collapse_stack(frame)] += 1
+                samples += 1
+            time.sleep(sample_interval)
+
+        self.last_profile = {
+            "startedAt": started_at,
+            "duration": duration,
+            "sampleInterval": sample_interval,
+            "samples": samples,
+            "stacks": [
+                {"stack": stack, "count": count}
+                for stack, count in stacks.most_common(200)
+            ],
+        }
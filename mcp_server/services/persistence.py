@@ -0,0 +1,134 @@
+"""File-based persistence layer for tasks and service state."""
+
+import asyncio
+import json
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, List, Optional
+from urllib.parse import quote
+
+from mcp_server.models.task import Task
+
+logger = logging.getLogger(__name__)
+
+
+class FilePersistenceLayer:
+    """Stores tasks and named service state as JSON files on local disk.
+
+    Writes go to a temporary file that is atomically renamed into place, and
+    all file I/O runs on a single worker thread to keep the event loop free.
+    Having one worker also applies operations in the order they were
+    submitted, so background saves of the same task cannot overtake each
+    other.
+    """
+
+    def __init__(self, storage_path: str):
+        """Initialize the persistence layer.
+
+        Args:
+            storage_path: Directory where data files are stored
+        """
+        self.storage_path = storage_path
+        self.tasks_path = os.path.join(storage_path, "tasks")
+        self.state_path = os.path.join(storage_path, "state")
+        os.makedirs(self.tasks_path, exist_ok=True)
+        os.makedirs(self.state_path, exist_ok=True)
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="persistence"
+        )
+
+    async def save_task(self, task: Task) -> None:
+        """Persist a task.
+
+        Args:
+            task: The task to save
+        """
+        data = task.model_dump(mode="json")
+        # The webhook token is excluded from serialization everywhere else
+        if task.push_notification is not None:
+            data["push_notification"]["token"] = task.push_notification.token
+        payload = json.dumps(data).encode("utf-8")
+        await self._run(self._write_file, self._task_file(task.id), payload)
+
+    async def delete_task(self, task_id: str) -> None:
+        """Remove a persisted task.
+
+        Args:
+            task_id: ID of the task to delete
+        """
+        await self._run(self._remove_file, self._task_file(task_id))
+
+    async def load_tasks(self) -> List[Task]:
+        """Load all persisted tasks.
+
+        Returns:
+            The stored tasks; unreadable files are skipped
+        """
+        return await self._run(self._read_tasks)
+
+    async def save_state(self, name: str, data: Any) -> None:
+        """Persist a JSON-serializable blob of named service state.
+
+        Args:
+            name: State name, e.g. "push_retry_queue"
+            data: The state to store
+        """
+        payload = json.dumps(data).encode("utf-8")
+        await self._run(self._write_file, self._state_file(name), payload)
+
+    async def load_state(self, name: str) -> Optional[Any]:
+        """Load named service state.
+
+        Args:
+            name: State name
+
+        Returns:
+            The stored state, or None if nothing was saved
+        """
+        return await self._run(self._read_json, self._state_file(name))
+
+    def _task_file(self, task_id: str) -> str:
+        return os.path.join(self.tasks_path, quote(task_id, safe="") + ".json")
+
+    def _state_file(self, name: str) -> str:
+        return os.path.join(self.state_path, quote(name, safe="") + ".json")
+
+    async def _run(self, func, *args):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, func, *args)
+
+    @staticmethod
+    def _write_file(path: str, data: bytes) -> None:
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    @staticmethod
+    def _remove_file(path: str) -> None:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+    @staticmethod
+    def _read_json(path: str) -> Optional[Any]:
+        try:
+            with open(path, "rb") as f:
+                return json.loads(f.read())
+        except FileNotFoundError:
+            return None
+
+    def _read_tasks(self) -> List[Task]:
+        tasks = []
+        for name in os.listdir(self.tasks_path):
+            if not name.endswith(".json"):
+                continue
+            path = os.path.join(self.tasks_path, name)
+            try:
+                with open(path, "rb") as f:
+                    tasks.append(Task.model_validate_json(f.read()))
+            except (OSError, ValueError) as e:
+                logger.error(f"Skipping unreadable task file {path}: {e}")
+        return tasks
@@ -0,0 +1,388 @@
+"""Push notification delivery for task state changes."""
+
+import asyncio
+import hashlib
+import hmac
+import ipaddress
+import json
+import logging
+import random
+import socket
+import time
+from collections import deque
+from typing import Any, Awaitable, Deque, Dict, Iterable, List, Optional, Set, Tuple
+from urllib.parse import urlsplit
+
+import aiohttp
+from aiohttp.abc import AbstractResolver, ResolveResult
+from aiohttp.resolver import DefaultResolver
+
+from mcp_server.models.task import PushNotificationConfig
+
+logger = logging.getLogger(__name__)
+
+SIGNATURE_HEADER = "X-A2A-Signature"
+TIMESTAMP_HEADER = "X-A2A-Timestamp"
+TOKEN_HEADER = "X-A2A-Notification-Token"
+
+# Name under which the retry queue is stored in the persistence layer
+RETRY_QUEUE_STATE = "push_retry_queue"
+
+# Upper bound for a single backoff delay, in seconds
+MAX_RETRY_DELAY = 300.0
+
+# Client error statuses that are retried along with all 5xx statuses
+RETRYABLE_STATUSES = frozenset({408, 429})
+
+
+def sign_payload(secret: str, timestamp: str, body: bytes) -> str:
+    """Compute the HMAC-SHA256 signature sent with a notification.
+
+    The signature covers the timestamp header and the raw request body so
+    receivers can reject both tampered and replayed deliveries.
+
+    Args:
+        secret: Shared signing key
+        timestamp: Value of the timestamp header
+        body: Raw request body
+
+    Returns:
+        Signature header value in the form "sha256=<hex digest>"
+    """
+    message = timestamp.encode("utf-8") + b"." + body
+    digest = hmac.new(secret.encode("utf-8"), message, hashlib.sha256).hexdigest()
+    return f"sha256={digest}"
+
+
+class DestinationPolicy:
+    """Decides which addresses webhook deliveries may connect to.
+
+    Only globally routable addresses are allowed by default, so a client
+    cannot make the server POST to loopback, private, link-local or cloud
+    metadata addresses. Networks that host legitimate internal webhooks can
+    be allowed explicitly.
+    """
+
+    def __init__(self, allowed_networks: Iterable[str] = ()):
+        """Initialize the destination policy.
+
+        Args:
+            allowed_networks: CIDR networks allowed even if not global
+
+        Raises:
+            ValueError: If a network is malformed
+        """
+        self.allowed_networks = [
+            ipaddress.ip_network(network.strip(), strict=False)
+            for network in allowed_networks
+            if network.strip()
+        ]
+
+    def is_allowed(self, address: str) -> bool:
+        """Whether deliveries may connect to an IP address.
+
+        Args:
+            address: IPv4 or IPv6 address
+
+        Returns:
+            True if the address is global or in an allowed network
+        """
+        ip = ipaddress.ip_address(address.split("%", 1)[0])
+        if ip.version == 6 and ip.ipv4_mapped is not None:
+            ip = ip.ipv4_mapped
+        if any(ip in network for network in self.allowed_networks):
+            return True
+        return ip.is_global and not ip.is_multicast
+
+    def check_url(self, url: str) -> None:
+        """Validate a webhook URL before accepting it.
+
+        Host names are checked again when they are resolved, see
+        PolicyResolver; this rejects what can be told from the URL alone.
+
+        Args:
+            url: The webhook URL
+
+        Raises:
+            ValueError: If the URL may not be used as a webhook
+        """
+        parts = urlsplit(url)
+        if parts.scheme not in ("http", "https") or not parts.hostname:
+            raise ValueError("pushNotification.url must be an http(s) URL")
+
+        host = parts.hostname.rstrip(".").lower()
+        if host == "localhost" or host.endswith(".localhost"):
+            host = "127.0.0.1"
+        try:
+            allowed = self.is_allowed(host)
+        except ValueError:
+            return  # A host name
+        if not allowed:
+            raise ValueError("pushNotification.url points to a blocked address")
+
+
+class PolicyResolver(AbstractResolver):
+    """DNS resolver dropping addresses the destination policy blocks.
+
+    Checking at connect time rather than when the URL is accepted also
+    covers host names whose DNS records change afterwards.
+    """
+
+    def __init__(self, policy: DestinationPolicy):
+        self.policy = policy
+        self._resolver = DefaultResolver()
+
+    async def resolve(
+        self, host: str, port: int = 0, family: socket.AddressFamily = socket.AF_INET
+    ) -> List[ResolveResult]:
+        hosts = await self._resolver.resolve(host, port, family)
+        allowed = [h for h in hosts if self.policy.is_allowed(h["host"])]
+        if not allowed:
+            raise OSError(f"{host} only resolves to blocked addresses")
+        return allowed
+
+    async def close(self) -> None:
+        await self._resolver.close()
+
+
+class PushNotificationSender:
+    """Delivers task events to client webhooks.
+
+    Events for the same destination are batched for a short window and sent
+    in one POST over a shared connection pool. Failed batches go to a bounded
+    retry queue, retried with exponential backoff and, when a persistence
+    layer is configured, saved so they survive restarts.
+    """
+
+    def __init__(
+        self,
+        signing_secret: str = "",
+        batch_window: float = 0.05,
+        max_batch_size: int = 100,
+        request_timeout: float = 10.0,
+        max_retries: int = 8,
+        retry_base_delay: float = 1.0,
+        retry_queue_size: int = 1000,
+        pool_size: int = 100,
+        policy: Optional[DestinationPolicy] = None,
+        persistence_layer=None,
+    ):
+        """Initialize the push notification sender.
+
+        Args:
+            signing_secret: Server-side key used to sign every delivery
+            batch_window: Seconds to wait for more events before sending a batch
+            max_batch_size: Number of events that triggers an immediate send
+            request_timeout: Timeout for a single delivery attempt, in seconds
+            max_retries: Delivery attempts after the first before giving up
+            retry_base_delay: Initial retry delay, doubled on every attempt
+            retry_queue_size: Maximum number of batches awaiting retry
+            pool_size: Maximum number of concurrent outbound connections
+            policy: Addresses deliveries may connect to; global ones if omitted
+            persistence_layer: Optional store for the retry queue
+        """
+        self.signing_secret = signing_secret
+        self.batch_window = batch_window
+        self.max_batch_size = max_batch_size
+        self.request_timeout = request_timeout
+        self.max_retries = max_retries
+        self.retry_base_delay = retry_base_delay
+        self.pool_size = pool_size
+        self.policy = policy or DestinationPolicy()
+        self.persistence_layer = persistence_layer
+
+        self._batches: Dict[Tuple[str, Optional[str]], List[Dict[str, Any]]] = {}
+        self._flush_handles: Dict[Tuple[str, Optional[str]], asyncio.TimerHandle] = {}
+        self._retry_queue: Deque[Dict[str, Any]] = deque(maxlen=retry_queue_size)
+        self._retry_dirty = False
+        self._retry_wakeup = asyncio.Event()
+        self._closing = False
+        self._retry_task: Optional[asyncio.Task] = None
+        self._inflight: Set[asyncio.Task] = set()
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    async def start(self) -> None:
+        """Open the connection pool and resume persisted retries."""
+        self._session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=self.pool_size, resolver=PolicyResolver(self.policy)
+            ),
+            timeout=aiohttp.ClientTimeout(total=self.request_timeout),
+        )
+        if self.persistence_layer:
+            stored = await self.persistence_layer.load_state(RETRY_QUEUE_STATE)
+            self._retry_queue.extend(stored or [])
+        self._closing = False
+        self._retry_task = asyncio.create_task(self._retry_loop())
+
+    async def close(self) -> None:
+        """Flush pending batches, persist the retry queue and close the pool."""
+        # Stopped with a flag rather than cancelled: wait_for() may swallow a
+        # cancellation that races with a wakeup
+        if self._retry_task is not None:
+            self._closing = True
+            self._retry_wakeup.set()
+            await self._retry_task
+            self._retry_task = None
+
+        for key in list(self._batches):
+            self._flush(key)
+        if self._inflight:
+            await asyncio.gather(*self._inflight, return_exceptions=True)
+
+        await self._persist_retry_queue()
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def notify(
+        self, config: PushNotificationConfig, task_id: str, event: Dict[str, Any]
+    ) -> None:
+        """Queue a task event for delivery to a webhook.
+
+        Args:
+            config: The task's push notification config
+            task_id: ID of the task the event belongs to
+            event: The event payload
+        """
+        key = (config.url, config.token)
+        batch = self._batches.setdefault(key, [])
+        batch.append({"taskId": task_id, **event})
+
+        if len(batch) >= self.max_batch_size:
+            self._flush(key)
+        elif key not in self._flush_handles:
+            loop = asyncio.get_running_loop()
+            self._flush_handles[key] = loop.call_later(
+                self.batch_window, self._flush, key
+            )
+
+    @property
+    def pending_retries(self) -> int:
+        """Number of batches waiting in the retry queue."""
+        return len(self._retry_queue)
+
+    def _flush(self, key: Tuple[str, Optional[str]]) -> None:
+        """Send the pending batch for a destination."""
+        handle = self._flush_handles.pop(key, None)
+        if handle is not None:
+            handle.cancel()
+        events = self._batches.pop(key, None)
+        if events:
+            url, token = key
+            self._spawn(self._send_batch(url, token, events))
+
+    def _spawn(self, coro: Awaitable[None]) -> None:
+        task = asyncio.ensure_future(coro)
+        self._inflight.add(task)
+        task.add_done_callback(self._inflight.discard)
+
+    async def _send_batch(
+        self, url: str, token: Optional[str], events: List[Dict[str, Any]]
+    ) -> None:
+        if not await self._deliver(url, token, events):
+            self._enqueue_retry(
+                {"url": url, "token": token, "events": events, "attempts": 1}
+            )
+
+    async def _retry_batch(self, entry: Dict[str, Any]) -> None:
+        if not await self._deliver(entry["url"], entry["token"], entry["events"]):
+            entry["attempts"] += 1
+            self._enqueue_retry(entry)
+
+    async def _deliver(
+        self, url: str, token: Optional[str], events: List[Dict[str, Any]]
+    ) -> bool:
+        """Make a single delivery attempt.
+
+        Only server errors, timeouts, rate limiting and network failures are
+        worth retrying; any other rejection drops the batch.
+
+        Returns:
+            False if the batch should be retried
+        """
+        if self._session is None:
+            return False
+
+        body = json.dumps({"events": events}).encode("utf-8")
+        timestamp = str(int(time.time()))
+        headers = {"Content-Type": "application/json", TIMESTAMP_HEADER: timestamp}
+        # Signed with the server's secret only: the client token travels in
+        # clear text, so a signature keyed on it could be forged by anyone
+        # who saw a delivery
+        if self.signing_secret:
+            headers[SIGNATURE_HEADER] = sign_payload(
+                self.signing_secret, timestamp, body
+            )
+        if token:
+            headers[TOKEN_HEADER] = token
+
+        try:
+            # Redirects are not followed: they could lead to a blocked address
+            async with self._session.post(
+                url, data=body, headers=headers, allow_redirects=False
+            ) as resp:
+                if 200 <= resp.status < 300:
+                    return True
+                if resp.status < 500 and resp.status not in RETRYABLE_STATUSES:
+                    # The destination rejected the batch; resending won't help
+                    logger.error(
+                        f"Dropping push notification(s) for {url}: "
+                        f"HTTP {resp.status}"
+                    )
+                    return True
+                logger.warning(f"Push notification to {url} failed: HTTP {resp.status}")
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.warning(f"Push notification to {url} failed: {e!r}")
+        return False
+
+    def _enqueue_retry(self, entry: Dict[str, Any]) -> None:
+        if entry["attempts"] > self.max_retries:
+            logger.error(
+                f"Dropping {len(entry['events'])} push notification(s) for "
+                f"{entry['url']} after {entry['attempts']} attempts"
+            )
+            return
+
+        if len(self._retry_queue) == self._retry_queue.maxlen:
+            dropped = self._retry_queue.popleft()
+            logger.error(f"Push retry queue full, dropping batch for {dropped['url']}")
+
+        delay = min(
+            self.retry_base_delay * 2 ** (entry["attempts"] - 1), MAX_RETRY_DELAY
+        )
+        # Jitter spreads retries for the same destination over time
+        entry["nextAttemptAt"] = time.time() + delay * random.uniform(0.5, 1.0)
+        self._retry_queue.append(entry)
+        self._retry_dirty = True
+        self._retry_wakeup.set()
+
+    async def _retry_loop(self) -> None:
+        """Resend queued batches once their backoff delay has elapsed."""
+        while not self._closing:
+            # Cleared before the pass, so wakeups during it are not lost
+            self._retry_wakeup.clear()
+            if self._retry_dirty:
+                self._retry_dirty = False
+                await self._persist_retry_queue()
+
+            timeout = None
+            if self._retry_queue:
+                entry = min(self._retry_queue, key=lambda e: e["nextAttemptAt"])
+                timeout = entry["nextAttemptAt"] - time.time()
+                if timeout <= 0:
+                    self._retry_queue.remove(entry)
+                    self._retry_dirty = True
+                    self._spawn(self._retry_batch(entry))
+                    continue
+
+            try:
+                await asyncio.wait_for(self._retry_wakeup.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _persist_retry_queue(self) -> None:
+        if self.persistence_layer:
+            await self.persistence_layer.save_state(
+                RETRY_QUEUE_STATE, list(self._retry_queue)
+            )
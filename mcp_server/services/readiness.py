@@ -0,0 +1,36 @@
+"""Readiness tracking for the MCP server."""
+
+import logging
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+class ReadinessState:
+    """Tracks whether the server should receive traffic.
+
+    Liveness (/health) only says the process is up. Readiness (/ready)
+    turns green once startup work such as persistence replay and warmup has
+    finished, and turns red again while the server is shutting down.
+    """
+
+    def __init__(self):
+        """Initialize readiness in the not-ready state."""
+        self.ready = False
+        self.reason: Optional[str] = "starting"
+
+    def mark_ready(self) -> None:
+        """Report the server as ready to receive traffic."""
+        self.ready = True
+        self.reason = None
+        logger.info("Server is ready")
+
+    def mark_not_ready(self, reason: str) -> None:
+        """Report the server as not ready.
+
+        Args:
+            reason: Short description returned by /ready
+        """
+        self.ready = False
+        self.reason = reason
+        logger.info(f"Server is not ready: {reason}")
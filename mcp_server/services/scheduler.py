@@ -0,0 +1,319 @@
+"""Durable scheduler for delayed, recurring and low-priority tasks."""
+
+import asyncio
+import heapq
+import itertools
+import logging
+import math
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from mcp_server.models.request import SubscribeTaskRequest
+from mcp_server.models.task import TERMINAL_STATES, TaskState
+
+logger = logging.getLogger(__name__)
+
+SCHEDULE_STATE = "scheduler"
+
+# Failed runs kept per schedule entry, most recent last
+MAX_FAILED_RUNS = 10
+
+
+class TaskScheduler:
+    """Starts scheduled tasks when due, by priority and fair share.
+
+    Schedule entries wait in a heap ordered by run time. Once due they move
+    to their session's ready heap, ordered by priority (higher first) and
+    then run time. A heap of sessions ordered by virtual time picks which
+    session runs next: every dispatch advances that session's virtual time
+    by one, and a session that becomes busy starts at the current virtual
+    clock rather than its old value. Sessions therefore take turns, and a
+    bulk session cannot starve others no matter how much it queues.
+
+    At most `concurrency` scheduled tasks run at once. Interactive requests
+    do not go through the scheduler, so they are never queued behind batch
+    work. Entries are plain JSON dicts saved through the persistence layer,
+    so pending work survives restarts.
+
+    Runs that cannot be started or end in the FAILED state are recorded on
+    their entry. A one-shot entry whose run failed stays in the schedule,
+    with no further run time, until it is unscheduled or replaced.
+    """
+
+    def __init__(self, task_manager, concurrency: int = 4, persistence_layer=None):
+        """Initialize the scheduler.
+
+        Args:
+            task_manager: The task manager that runs scheduled tasks
+            concurrency: Maximum number of scheduled tasks running at once
+            persistence_layer: Optional store for the schedule
+        """
+        self.task_manager = task_manager
+        self.concurrency = concurrency
+        self.persistence_layer = persistence_layer
+
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._seq = itertools.count()
+        # (runAt, seq, entry) for entries that are not due yet
+        self._timers: List[Tuple[float, int, Dict[str, Any]]] = []
+        # Per session (-priority, runAt, seq, entry) for entries that are due
+        self._ready: Dict[str, List[Tuple[int, float, int, Dict[str, Any]]]] = {}
+        # (virtual time, seq, session) for sessions with due entries
+        self._sessions: List[Tuple[float, int, str]] = []
+        self._vtime: Dict[str, float] = {}
+        self._clock = 0.0
+        self._running = 0
+        self._dirty = False
+        self._wakeup = asyncio.Event()
+        self._closing = False
+        self._loop_task: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        """Load the persisted schedule and start dispatching."""
+        if self.persistence_layer:
+            stored = await self.persistence_layer.load_state(SCHEDULE_STATE)
+            for entry in stored or []:
+                self._add(entry)
+            if self._entries:
+                logger.info(f"Restored {len(self._entries)} scheduled task(s)")
+        self._closing = False
+        self._loop_task = asyncio.create_task(self._run_loop())
+
+    async def close(self) -> None:
+        """Stop dispatching and persist the schedule."""
+        # Stopped with a flag rather than cancelled: wait_for() may swallow a
+        # cancellation that races with a wakeup
+        if self._loop_task is not None:
+            self._closing = True
+            self._wakeup.set()
+            await self._loop_task
+            self._loop_task = None
+        await self._persist()
+
+    def schedule(
+        self,
+        params: Dict[str, Any],
+        run_at: Optional[float] = None,
+        interval: Optional[float] = None,
+        priority: int = 0,
+    ) -> Dict[str, Any]:
+        """Schedule a task, replacing any schedule with the same ID.
+
+        Args:
+            params: tasks/sendSubscribe params of the task to run
+            run_at: Epoch seconds of the first run; now if omitted
+            interval: Seconds between runs of a recurring task
+            priority: Higher runs first among a session's due tasks
+
+        Returns:
+            The schedule entry
+
+        Raises:
+            ValueError: If no handler serves the task's skill or agent
+        """
+        try:
+            self.task_manager.handlers.route(params.get("skill"), params.get("agentId"))
+        except LookupError as e:
+            raise ValueError(str(e)) from e
+
+        entry = {
+            "id": params["id"],
+            "sessionId": params.get("sessionId"),
+            "priority": priority,
+            "runAt": run_at if run_at is not None else time.time(),
+            "interval": interval,
+            "runs": 0,
+            "failedRuns": [],
+            "params": params,
+        }
+        self._add(entry)
+        self._dirty = True
+        self._wakeup.set()
+        return entry
+
+    def unschedule(self, schedule_id: str) -> bool:
+        """Cancel a schedule; runs that already started are not affected.
+
+        Args:
+            schedule_id: ID the task was scheduled under
+
+        Returns:
+            False if no such schedule exists
+        """
+        # Heap items of the entry are skipped lazily once it is gone
+        if self._entries.pop(schedule_id, None) is None:
+            return False
+        self._dirty = True
+        return True
+
+    def get(self, schedule_id: str) -> Optional[Dict[str, Any]]:
+        """Return a pending schedule entry.
+
+        Args:
+            schedule_id: ID the task was scheduled under
+
+        Returns:
+            The entry, or None if it does not exist
+        """
+        return self._entries.get(schedule_id)
+
+    @property
+    def pending(self) -> int:
+        """Number of schedule entries, including failed one-shot entries."""
+        return len(self._entries)
+
+    def _add(self, entry: Dict[str, Any]) -> None:
+        """Track an entry and put it in the time index if it has a run left."""
+        entry.setdefault("failedRuns", [])
+        self._entries[entry["id"]] = entry
+        if entry["runAt"] is not None:
+            heapq.heappush(self._timers, (entry["runAt"], next(self._seq), entry))
+
+    def _is_current(self, entry: Dict[str, Any]) -> bool:
+        """Whether a heap item still refers to a pending entry."""
+        return self._entries.get(entry["id"]) is entry
+
+    def _make_ready(self, entry: Dict[str, Any]) -> None:
+        """Move a due entry to its session's ready heap."""
+        session = entry["sessionId"] or ""
+        ready = self._ready.get(session)
+        if ready is None:
+            ready = self._ready[session] = []
+            # A newly busy session starts at the current virtual clock
+            vtime = max(self._vtime.get(session, 0.0), self._clock)
+            self._vtime[session] = vtime
+            heapq.heappush(self._sessions, (vtime, next(self._seq), session))
+        heapq.heappush(
+            ready, (-entry["priority"], entry["runAt"], next(self._seq), entry)
+        )
+
+    def _next_ready(self) -> Optional[Dict[str, Any]]:
+        """Pop the next entry to run, by fair share and then priority."""
+        while self._sessions:
+            vtime, _, session = heapq.heappop(self._sessions)
+            ready = self._ready[session]
+            entry = None
+            while ready:
+                candidate = heapq.heappop(ready)[3]
+                if self._is_current(candidate):
+                    entry = candidate
+                    break
+
+            if ready:
+                self._vtime[session] = vtime + 1
+                heapq.heappush(self._sessions, (vtime + 1, next(self._seq), session))
+            else:
+                del self._ready[session]
+                del self._vtime[session]
+            if entry is not None:
+                self._clock = vtime
+                return entry
+        return None
+
+    def _dispatch(self, entry: Dict[str, Any], now: float) -> None:
+        """Start one run of an entry and reschedule it if it recurs."""
+        entry["runs"] += 1
+        params = dict(entry["params"])
+        interval = entry["interval"]
+        if interval:
+            params["id"] = f"{entry['id']}:{entry['runs']}"
+            # Missed runs, e.g. while the server was down, are coalesced
+            missed = math.floor((now - entry["runAt"]) / interval) + 1
+            entry["runAt"] += max(missed, 1) * interval
+            heapq.heappush(self._timers, (entry["runAt"], next(self._seq), entry))
+        else:
+            del self._entries[entry["id"]]
+        self._dirty = True
+
+        self._running += 1
+        asyncio.create_task(self._start_run(entry, params))
+
+    async def _start_run(self, entry: Dict[str, Any], params: Dict[str, Any]) -> None:
+        """Submit a scheduled run and hold its slot until it finishes."""
+        task_id = params["id"]
+
+        def on_event(_: str, event: Dict[str, Any]) -> None:
+            state = event.get("state")
+            if state in TERMINAL_STATES:
+                self.task_manager.remove_listener(task_id, on_event)
+                if state == TaskState.FAILED:
+                    self._record_failure(entry, task_id, event.get("error"))
+                self._release()
+
+        # Listen first so a fast task cannot finish unnoticed
+        self.task_manager.add_listener(task_id, on_event)
+        try:
+            response = await self.task_manager.on_subscribe_task(
+                SubscribeTaskRequest.model_construct(id=None, params=params)
+            )
+            error = response.error
+        except Exception as e:
+            error = {"message": str(e)}
+        if error is not None:
+            logger.warning(
+                f"Could not start scheduled task {task_id}: {error['message']}"
+            )
+            self.task_manager.remove_listener(task_id, on_event)
+            self._record_failure(entry, task_id, error["message"])
+            self._release()
+
+    def _record_failure(
+        self, entry: Dict[str, Any], task_id: str, error: Optional[str]
+    ) -> None:
+        """Record a failed run on its schedule entry.
+
+        Args:
+            entry: The entry the run belongs to
+            task_id: ID of the failed run
+            error: Why the run failed
+        """
+        failed_runs = entry["failedRuns"]
+        failed_runs.append({"taskId": task_id, "error": error, "at": time.time()})
+        del failed_runs[:-MAX_FAILED_RUNS]
+        # Keep a finished one-shot entry so the failure can be looked up,
+        # unless the ID has been scheduled again meanwhile
+        if not entry["interval"] and entry["id"] not in self._entries:
+            entry["runAt"] = None
+            self._entries[entry["id"]] = entry
+        self._dirty = True
+        self._wakeup.set()
+
+    def _release(self) -> None:
+        """Free a concurrency slot."""
+        self._running -= 1
+        self._wakeup.set()
+
+    async def _run_loop(self) -> None:
+        """Move due entries to the ready heaps and dispatch within capacity."""
+        while not self._closing:
+            # Cleared before the pass, so wakeups during it are not lost
+            self._wakeup.clear()
+            now = time.time()
+            while self._timers and self._timers[0][0] <= now:
+                entry = heapq.heappop(self._timers)[2]
+                if self._is_current(entry):
+                    self._make_ready(entry)
+
+            while self._running < self.concurrency and self.task_manager.accepting:
+                entry = self._next_ready()
+                if entry is None:
+                    break
+                self._dispatch(entry, now)
+
+            if self._dirty:
+                self._dirty = False
+                await self._persist()
+
+            timeout = None
+            if self._timers:
+                timeout = max(0.0, self._timers[0][0] - time.time())
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _persist(self) -> None:
+        if self.persistence_layer:
+            await self.persistence_layer.save_state(
+                SCHEDULE_STATE, list(self._entries.values())
+            )
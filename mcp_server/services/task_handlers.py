@@ -0,0 +1,223 @@
+"""Pluggable task handlers and routing of tasks to them."""
+
+import asyncio
+import logging
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Union,
+)
+
+from mcp_server.models.task import Message, Task
+
+logger = logging.getLogger(__name__)
+
+# Agent output: a Message, a list of parts, a single part dict, or plain text
+HandlerOutput = Union[Message, List[Dict[str, Any]], Dict[str, Any], str]
+
+# A handler either produces its whole result at once (returned directly or
+# awaited), or is an async generator yielding partial output as it goes.
+# Handlers run under the task's deadline: current_deadline() returns it, and
+# outbound calls should use remaining_timeout(own_timeout) from
+# mcp_server.services.deadline so they give up when the task would anyway
+TaskHandler = Callable[
+    [Task],
+    Union[HandlerOutput, Awaitable[HandlerOutput], AsyncIterator[HandlerOutput]],
+]
+
+
+def to_parts(output: HandlerOutput) -> List[Dict[str, Any]]:
+    """Normalize handler output to a list of message parts.
+
+    Args:
+        output: Output returned or yielded by a handler
+
+    Returns:
+        The message parts
+    """
+    if isinstance(output, str):
+        return [{"type": "text", "text": output}]
+    if isinstance(output, Message):
+        return output.parts
+    if isinstance(output, dict):
+        return [output]
+    return list(output)
+
+
+def _is_plain_text(part: Dict[str, Any]) -> bool:
+    """Whether a part is text without other fields that merging would lose."""
+    return part.get("type") == "text" and part.keys() <= {"type", "text"}
+
+
+class MessageBuilder:
+    """Appends streamed parts to a message, merging adjacent text parts.
+
+    Text chunks that continue a trailing text part are buffered and only
+    joined into that part by flush(), so streaming n chunks copies the text
+    once per flush rather than once per chunk. Readers must call flush()
+    before looking at the message.
+    """
+
+    def __init__(self, message: Message):
+        """Initialize the builder.
+
+        Args:
+            message: The message to append to, usually already on the task
+        """
+        self.message = message
+        self._pending: List[str] = []
+
+    def append(self, parts: List[Dict[str, Any]]) -> None:
+        """Append parts to the message.
+
+        Args:
+            parts: Parts produced by the handler
+        """
+        message_parts = self.message.parts
+        for part in parts:
+            if (
+                _is_plain_text(part)
+                and message_parts
+                and _is_plain_text(message_parts[-1])
+            ):
+                self._pending.append(part["text"] or "")
+            else:
+                self.flush()
+                message_parts.append(dict(part))
+
+    def flush(self) -> Message:
+        """Join buffered text into the message.
+
+        Returns:
+            The up-to-date message
+        """
+        if self._pending:
+            tail = self.message.parts[-1]
+            self._pending.insert(0, tail["text"] or "")
+            tail["text"] = "".join(self._pending)
+            self._pending.clear()
+        return self.message
+
+
+class HandlerRegistry:
+    """Routes tasks to handlers by skill, then by agent, then to a default.
+
+    Handlers are registered under a name. A task whose `skill` names a
+    registered handler goes to that handler; otherwise its `agent_id` is
+    tried, and tasks naming neither go to the default handler.
+    """
+
+    def __init__(self, default: Optional[TaskHandler] = None):
+        """Initialize the registry.
+
+        Args:
+            default: Handler for tasks that do not name a skill or agent
+        """
+        self._handlers: Dict[str, TaskHandler] = {}
+        self.default = default
+
+    def register(self, name: str, handler: TaskHandler) -> None:
+        """Register a handler.
+
+        Args:
+            name: Skill or agent ID the handler serves
+            handler: The handler
+
+        Raises:
+            ValueError: If a handler is already registered under the name
+        """
+        if name in self._handlers:
+            raise ValueError(f"Task handler already registered: {name}")
+        self._handlers[name] = handler
+        logger.debug(f"Registered task handler: {name}")
+
+    @property
+    def names(self) -> List[str]:
+        """Names of all registered handlers."""
+        return list(self._handlers)
+
+    def resolve(self, task: Task) -> TaskHandler:
+        """Find the handler for a task.
+
+        Args:
+            task: The task to route
+
+        Returns:
+            The handler
+
+        Raises:
+            LookupError: If the task names an unknown skill or agent, or
+                names neither and there is no default handler
+        """
+        return self.route(task.skill, task.agent_id)
+
+    def route(
+        self, skill: Optional[str] = None, agent_id: Optional[str] = None
+    ) -> TaskHandler:
+        """Find the handler for a skill or agent ID, before a task exists.
+
+        Args:
+            skill: Skill the task asks for
+            agent_id: Agent the task is addressed to
+
+        Returns:
+            The handler
+
+        Raises:
+            LookupError: See resolve()
+        """
+        for name in (skill, agent_id):
+            if name is None:
+                continue
+            handler = self._handlers.get(name)
+            if handler is not None:
+                return handler
+            raise LookupError(f"No handler for {name}")
+        if self.default is None:
+            raise LookupError("No default task handler")
+        return self.default
+
+
+class EchoHandler:
+    """Deterministic stand-in for an LLM agent, for tests and benchmarks.
+
+    Streams the text of the task's latest user message back word by word,
+    like a model emitting tokens, optionally pausing between chunks.
+    """
+
+    def __init__(self, delay: float = 0.0, repeat: int = 1):
+        """Initialize the echo handler.
+
+        Args:
+            delay: Seconds to wait before each chunk
+            repeat: Number of times the input is echoed
+        """
+        self.delay = delay
+        self.repeat = repeat
+
+    async def __call__(self, task: Task) -> AsyncIterator[HandlerOutput]:
+        """Yield the echoed text in word-sized chunks.
+
+        Args:
+            task: The task to process
+        """
+        text = ""
+        for message in reversed(task.messages):
+            if message.role == "user":
+                text = " ".join(
+                    part.get("text") or ""
+                    for part in message.parts
+                    if part.get("type") == "text"
+                )
+                break
+
+        words = text.split(" ") * self.repeat
+        for index, word in enumerate(words):
+            if self.delay:
+                await asyncio.sleep(self.delay)
+            yield word if index == 0 else f" {word}"
@@ -0,0 +1,187 @@
+"""Secondary task indexes for filtered, paginated listing."""
+
+import base64
+import json
+from bisect import bisect_left, insort
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from mcp_server.models.task import Task, TaskState
+
+# Sort key of a task in every index: last update time, then ID as tiebreak
+IndexKey = Tuple[datetime, str]
+
+
+def encode_cursor(key: IndexKey) -> str:
+    """Encode the key of the last listed task as an opaque page cursor.
+
+    Args:
+        key: Index key of the last task on the page
+
+    Returns:
+        URL-safe cursor string
+    """
+    raw = json.dumps([key[0].isoformat(), key[1]]).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> IndexKey:
+    """Decode a cursor produced by encode_cursor().
+
+    Args:
+        cursor: Cursor string from a previous page
+
+    Returns:
+        The index key the next page starts after
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        updated_at, task_id = json.loads(base64.urlsafe_b64decode(cursor))
+        key = datetime.fromisoformat(updated_at), str(task_id)
+    except (TypeError, ValueError) as e:
+        raise ValueError("Invalid cursor") from e
+    # Index keys are naive UTC; an aware time cannot be compared with them
+    if key[0].tzinfo is not None:
+        raise ValueError("Invalid cursor")
+    return key
+
+
+class TaskIndex:
+    """Time-ordered task indexes by session, by state and by both.
+
+    Each index is a list of (updated_at, task_id) keys kept sorted with
+    bisect, so every filter combination maps to one list. A page is read
+    by bisecting to the cursor and walking backwards, which costs
+    O(log n + page size) no matter how many tasks are stored. Re-indexing
+    a task after a state change costs one removal and one insertion per
+    list it appears in.
+    """
+
+    def __init__(self):
+        """Initialize empty indexes."""
+        self._all: List[IndexKey] = []
+        self._by_session: Dict[str, List[IndexKey]] = {}
+        self._by_state: Dict[TaskState, List[IndexKey]] = {}
+        self._by_session_state: Dict[Tuple[str, TaskState], List[IndexKey]] = {}
+        # What each task was last indexed under, needed to remove it again
+        self._entries: Dict[str, Tuple[IndexKey, Optional[str], TaskState]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def add(self, task: Task) -> None:
+        """Index a task, replacing its previous entry if it has one.
+
+        Args:
+            task: The task to index under its current state and update time
+        """
+        self.remove(task.id)
+        key = (task.updated_at, task.id)
+        for index in self._lists(task.session_id, task.state, create=True):
+            insort(index, key)
+        self._entries[task.id] = (key, task.session_id, task.state)
+
+    def remove(self, task_id: str) -> bool:
+        """Drop a task from all indexes.
+
+        Args:
+            task_id: ID of the task
+
+        Returns:
+            False if the task was not indexed
+        """
+        entry = self._entries.pop(task_id, None)
+        if entry is None:
+            return False
+        key, session_id, state = entry
+        for index in self._lists(session_id, state):
+            del index[bisect_left(index, key)]
+        # Drop emptied lists so abandoned sessions do not accumulate
+        if session_id is not None:
+            if not self._by_session[session_id]:
+                del self._by_session[session_id]
+            if not self._by_session_state[(session_id, state)]:
+                del self._by_session_state[(session_id, state)]
+        if not self._by_state[state]:
+            del self._by_state[state]
+        return True
+
+    def page(
+        self,
+        limit: int,
+        session_id: Optional[str] = None,
+        state: Optional[TaskState] = None,
+        updated_after: Optional[datetime] = None,
+        after: Optional[IndexKey] = None,
+    ) -> Tuple[List[str], Optional[IndexKey]]:
+        """Return one page of task IDs, most recently updated first.
+
+        Args:
+            limit: Maximum number of IDs to return
+            session_id: Only tasks of this session
+            state: Only tasks in this state
+            updated_after: Only tasks updated strictly after this time
+            after: Key of the last task of the previous page
+
+        Returns:
+            The task IDs, and the key to resume from if more tasks match
+        """
+        index = self._select(session_id, state)
+        position = bisect_left(index, after) if after is not None else len(index)
+        task_ids: List[str] = []
+        while position > 0 and len(task_ids) < limit:
+            key = index[position - 1]
+            if updated_after is not None and key[0] <= updated_after:
+                return task_ids, None
+            task_ids.append(key[1])
+            position -= 1
+
+        has_more = position > 0 and (
+            updated_after is None or index[position - 1][0] > updated_after
+        )
+        return task_ids, (index[position] if has_more else None)
+
+    def updated_before(self, state: TaskState, cutoff: datetime) -> Iterator[str]:
+        """Yield IDs of tasks in a state that were last updated before a time.
+
+        Args:
+            state: State to look in
+            cutoff: Exclusive upper bound on the update time
+
+        Returns:
+            Iterator over task IDs, oldest first
+        """
+        index = self._by_state.get(state, [])
+        for key in index[: bisect_left(index, (cutoff,))]:
+            yield key[1]
+
+    def _select(
+        self, session_id: Optional[str], state: Optional[TaskState]
+    ) -> List[IndexKey]:
+        """Return the single index list matching a filter combination."""
+        if session_id is not None and state is not None:
+            return self._by_session_state.get((session_id, state), [])
+        if session_id is not None:
+            return self._by_session.get(session_id, [])
+        if state is not None:
+            return self._by_state.get(state, [])
+        return self._all
+
+    def _lists(
+        self, session_id: Optional[str], state: TaskState, create: bool = False
+    ) -> List[List[IndexKey]]:
+        """Return every index list a task with these attributes belongs in."""
+        if create:
+            lists = [self._all, self._by_state.setdefault(state, [])]
+            if session_id is not None:
+                lists.append(self._by_session.setdefault(session_id, []))
+                lists.append(self._by_session_state.setdefault((session_id, state), []))
+            return lists
+
+        lists = [self._all, self._by_state[state]]
+        if session_id is not None:
+            lists.append(self._by_session[session_id])
+            lists.append(self._by_session_state[(session_id, state)])
+        return lists
@@ -0,0 +1,65 @@
+"""Labels describing what each asyncio task is working on.
+
+Kept apart from the diagnostics service so the request and task paths can
+label themselves without importing it while diagnostics are disabled.
+"""
+
+import asyncio
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
+
+_labels: Dict[asyncio.Task, str] = {}
+_enabled = False
+
+
+def enable_labels() -> None:
+    """Start recording labels."""
+    global _enabled
+    _enabled = True
+
+
+def disable_labels() -> None:
+    """Stop recording labels and forget the current ones."""
+    global _enabled
+    _enabled = False
+    _labels.clear()
+
+
+def get_label(task: Optional[asyncio.Task]) -> Optional[str]:
+    """Return the label of an asyncio task, if it has one.
+
+    Args:
+        task: The task to look up, possibly None
+    """
+    if task is None:
+        return None
+    return _labels.get(task)
+
+
+@contextmanager
+def track(label: str) -> Iterator[None]:
+    """Label the current asyncio task for slow-callback attribution.
+
+    This is a no-op unless loop diagnostics are running.
+
+    Args:
+        label: Description such as "POST /" or "task:<id>"
+    """
+    if not _enabled:
+        yield
+        return
+
+    current = asyncio.current_task()
+    if current is None:
+        yield
+        return
+
+    previous = _labels.get(current)
+    _labels[current] = label
+    try:
+        yield
+    finally:
+        if previous is None:
+            _labels.pop(current, None)
+        else:
+            _labels[current] = previous
@@ -1,58 +1,162 @@
 """Task management service for the MCP server."""
 
+import inspect
 import logging
 import asyncio
-from typing import Dict, Any, Optional
-from datetime import datetime
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+)
+from datetime import datetime, timedelta, timezone
 
-from mcp_server.models.task import Task, TaskState, Message
+from mcp_server.config import get_settings
+from mcp_server.models.task import (
+    TERMINAL_STATES,
+    Task,
+    TaskState,
+    Message,
+    PushNotificationConfig,
+)
 from mcp_server.models.request import SendTaskRequest, SubscribeTaskRequest
 from mcp_server.models.response import SendTaskResponse, SubscribeTaskResponse
+from mcp_server.services.deadline import Deadline, deadline_scope, resolve_timeout
+from mcp_server.services.task_labels import track
+from mcp_server.services.task_handlers import (
+    EchoHandler,
+    HandlerRegistry,
+    MessageBuilder,
+    to_parts,
+)
+from mcp_server.services.task_index import TaskIndex, decode_cursor, encode_cursor
 
 logger = logging.getLogger(__name__)
 
+# Callback invoked with (task_id, event) for every event published on a task
+TaskListener = Callable[[str, Dict[str, Any]], None]
+
+T = TypeVar("T")
+
+# Error returned for new work once shutdown has begun
+SHUTTING_DOWN_ERROR = {"code": -32000, "message": "Server is shutting down"}
+
 
 class TaskManager:
     """Manages tasks and their lifecycle."""
 
-    def __init__(self, persistence_layer=None):
-        """Initialize the task manager."""
+    def __init__(self, persistence_layer=None, push_sender=None, handlers=None):
+        """Initialize the task manager.
+
+        Args:
+            persistence_layer: Optional storage for tasks
+            push_sender: Optional webhook notification sender
+            handlers: Handler registry; defaults to one echoing the input
+        """
         self.tasks: Dict[str, Task] = {}
+        self.index = TaskIndex()
         self.stream_queues: Dict[str, asyncio.Queue] = {}
+        self.listeners: Dict[str, Set[TaskListener]] = {}
         self.persistence_layer = persistence_layer
+        self.push_sender = push_sender
+        self.handlers = handlers or HandlerRegistry(default=EchoHandler())
+        # Builders of responses still streaming, flushed before tasks are read
+        self._builders: Dict[str, MessageBuilder] = {}
+
+        # Whether new tasks are accepted; cleared when shutdown begins
+        self.accepting = True
+        self._running: Dict[str, asyncio.Task] = {}
+        self._interrupted: Set[str] = set()
+        self._pending_writes: Set[asyncio.Task] = set()
+
+        settings = get_settings()
+        self.default_timeout = settings.task_default_timeout
+        self.max_timeout = settings.task_max_timeout
+        self.retention = settings.task_retention_seconds
 
     async def on_send_task(self, request: SendTaskRequest) -> SendTaskResponse:
         """Handle synchronous task requests."""
+        if not self.accepting:
+            return SendTaskResponse(id=request.id, error=SHUTTING_DOWN_ERROR)
+
         # Basic validation
         if not request.params or not request.params.get("id"):
             return SendTaskResponse(
                 id=request.id, error={"code": -32602, "message": "Invalid params"}
             )
 
-        # Create task
+        try:
+            push_config = self._parse_push_config(request.params)
+        except ValueError as e:
+            return SendTaskResponse(
+                id=request.id,
+                error={"code": -32602, "message": f"Invalid params: {e}"},
+            )
+
+        # Create task, unless one with the ID is still running
         task_id = request.params.get("id")
+        existing = self.tasks.get(task_id)
+        if existing is not None and existing.state not in TERMINAL_STATES:
+            return SendTaskResponse(
+                id=request.id,
+                error={
+                    "code": -32602,
+                    "message": f"Invalid params: task {task_id} is still running",
+                },
+            )
         task = Task(
             id=task_id,
             session_id=request.params.get("sessionId"),
             state=TaskState.ACTIVE,
-            messages=[Message(**request.params.get("message", {}))],
+            messages=[self._to_message(request.params.get("message", {}))],
             created_at=datetime.utcnow(),
             updated_at=datetime.utcnow(),
+            push_notification=push_config,
+            skill=request.params.get("skill"),
+            agent_id=request.params.get("agentId"),
         )
-        self.tasks[task_id] = task
+        try:
+            self.handlers.resolve(task)
+        except LookupError as e:
+            return SendTaskResponse(
+                id=request.id,
+                error={"code": -32602, "message": f"Invalid params: {e}"},
+            )
+        self._add_task(task)
 
         # Persist if needed
         if self.persistence_layer:
             await self.persistence_layer.save_task(task)
 
-        # Mock processing
-        response_message = Message(
-            role="agent",
-            parts=[{"type": "text", "text": "Task processed successfully"}],
-        )
-        task.messages.append(response_message)
-        task.state = TaskState.COMPLETED
+        deadline = self._create_deadline(request.params)
+        runner = self._start(task, self._run_with_deadline(task, deadline))
+        try:
+            # Shielded so that a client disconnecting, which cancels this
+            # request, does not cancel the task and leave it unfinished
+            response_message = await asyncio.shield(runner)
+        except asyncio.CancelledError:
+            if task.id not in self._interrupted:
+                raise
+            # Checkpointed by shutdown; the next server instance resumes it
+            return SendTaskResponse(
+                id=request.id,
+                error={
+                    "code": -32000,
+                    "message": "Server is shutting down; the task will resume "
+                    "after restart",
+                },
+            )
 
+        if response_message is None:
+            return SendTaskResponse(
+                id=request.id,
+                result={"taskId": task.id, "state": task.state, "error": task.error},
+            )
         return SendTaskResponse(
             id=request.id,
             result={
@@ -66,30 +170,61 @@ class TaskManager:
         self, request: SubscribeTaskRequest
     ) -> SubscribeTaskResponse:
         """Handle streaming task subscription requests."""
+        if not self.accepting:
+            return SubscribeTaskResponse(id=request.id, error=SHUTTING_DOWN_ERROR)
+
         # Basic validation
         if not request.params or not request.params.get("id"):
             return SubscribeTaskResponse(
                 id=request.id, error={"code": -32602, "message": "Invalid params"}
             )
 
-        # Create task
+        try:
+            push_config = self._parse_push_config(request.params)
+        except ValueError as e:
+            return SubscribeTaskResponse(
+                id=request.id,
+                error={"code": -32602, "message": f"Invalid params: {e}"},
+            )
+
+        # Create task, unless one with the ID is still running
         task_id = request.params.get("id")
+        existing = self.tasks.get(task_id)
+        if existing is not None and existing.state not in TERMINAL_STATES:
+            return SubscribeTaskResponse(
+                id=request.id,
+                error={
+                    "code": -32602,
+                    "message": f"Invalid params: task {task_id} is still running",
+                },
+            )
         task = Task(
             id=task_id,
             session_id=request.params.get("sessionId"),
             state=TaskState.ACTIVE,
-            messages=[Message(**request.params.get("message", {}))],
+            messages=[self._to_message(request.params.get("message", {}))],
             created_at=datetime.utcnow(),
             updated_at=datetime.utcnow(),
+            push_notification=push_config,
+            skill=request.params.get("skill"),
+            agent_id=request.params.get("agentId"),
         )
-        self.tasks[task_id] = task
+        try:
+            self.handlers.resolve(task)
+        except LookupError as e:
+            return SubscribeTaskResponse(
+                id=request.id,
+                error={"code": -32602, "message": f"Invalid params: {e}"},
+            )
+        self._add_task(task)
 
         # Persist if needed
         if self.persistence_layer:
             await self.persistence_layer.save_task(task)
 
         # Start processing asynchronously
-        asyncio.create_task(self._process_task_async(task))
+        deadline = self._create_deadline(request.params)
+        self._start(task, self._run_with_deadline(task, deadline))
 
         return SubscribeTaskResponse(
             id=request.id,
@@ -100,12 +235,192 @@ class TaskManager:
             },
         )
 
+    async def restore(self) -> int:
+        """Load persisted tasks into memory and resume unfinished ones.
+
+        Tasks that were still running when the previous instance shut down
+        were checkpointed in a non-terminal state; they are processed again
+        with the default timeout, since the original deadline has passed.
+
+        Returns:
+            Number of tasks restored
+        """
+        if not self.persistence_layer:
+            return 0
+        tasks = await self.persistence_layer.load_tasks()
+        resumed = 0
+        for task in tasks:
+            self._add_task(task)
+            if task.state not in TERMINAL_STATES:
+                # The handler runs again from the start, so a partial response
+                # from the interrupted run is replaced rather than kept
+                if len(task.messages) > 1 and task.messages[-1].role == "agent":
+                    task.messages.pop()
+                deadline = Deadline(self.default_timeout)
+                self._start(task, self._run_with_deadline(task, deadline))
+                resumed += 1
+        logger.info(f"Restored {len(tasks)} persisted task(s), resumed {resumed}")
+        return len(tasks)
+
+    async def shutdown(self, timeout: float) -> List[str]:
+        """Stop accepting tasks, then drain or checkpoint running ones.
+
+        Running tasks get `timeout` seconds to finish. Tasks still running
+        after that are cancelled and saved in their current state, so the
+        next instance resumes them from restore().
+
+        Args:
+            timeout: Seconds to wait for running tasks
+
+        Returns:
+            IDs of the tasks that were interrupted
+        """
+        self.accepting = False
+        running = dict(self._running)
+        interrupted: List[str] = []
+        if running:
+            logger.info(
+                f"Draining {len(running)} running task(s) for up to {timeout:g}s"
+            )
+            _, pending = await asyncio.wait(running.values(), timeout=timeout)
+            interrupted = [
+                task_id for task_id, runner in running.items() if runner in pending
+            ]
+            self._interrupted.update(interrupted)
+            for runner in pending:
+                runner.cancel()
+            if pending:
+                await asyncio.wait(pending)
+
+        for task_id in interrupted:
+            task = self.tasks[task_id]
+            if task.state in TERMINAL_STATES:
+                continue
+            if self.persistence_layer:
+                logger.info(f"Checkpointing task {task_id} in state {task.state.value}")
+                self._save_task(task)
+            else:
+                logger.warning(f"Task {task_id} interrupted without persistence")
+
+        if self._pending_writes:
+            await asyncio.wait(set(self._pending_writes))
+        return interrupted
+
+    def close_streams(self) -> None:
+        """Tell every open task stream to reconnect to another instance."""
+        for queue in self.stream_queues.values():
+            queue.put_nowait({"reconnect": {"reason": "server shutting down"}})
+
     def get_task(self, task_id: str) -> Optional[Task]:
         """Get task by ID."""
-        return self.tasks.get(task_id)
+        task = self.tasks.get(task_id)
+        if task is not None:
+            self._flush_output(task)
+        return task
+
+    def list_tasks(
+        self,
+        limit: int,
+        session_id: Optional[str] = None,
+        state: Optional[TaskState] = None,
+        updated_after: Optional[datetime] = None,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[Task], Optional[str]]:
+        """List tasks, most recently updated first.
+
+        Args:
+            limit: Maximum number of tasks to return
+            session_id: Only tasks of this session
+            state: Only tasks in this state
+            updated_after: Only tasks updated strictly after this time
+            cursor: Cursor returned with the previous page
+
+        Returns:
+            The tasks, and the cursor of the next page if there is one
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        after = decode_cursor(cursor) if cursor else None
+        if updated_after is not None and updated_after.tzinfo is not None:
+            # Task timestamps are naive UTC
+            updated_after = updated_after.astimezone(timezone.utc).replace(tzinfo=None)
+        task_ids, next_key = self.index.page(
+            limit,
+            session_id=session_id,
+            state=state,
+            updated_after=updated_after,
+            after=after,
+        )
+        tasks = [self.tasks[task_id] for task_id in task_ids]
+        for task in tasks:
+            self._flush_output(task)
+        return tasks, (encode_cursor(next_key) if next_key else None)
+
+    def remove_task(self, task_id: str) -> bool:
+        """Forget a task, cancelling its processing and deleting its checkpoint.
+
+        Args:
+            task_id: ID of the task
+
+        Returns:
+            False if the task was not known
+        """
+        task = self.tasks.pop(task_id, None)
+        if task is None:
+            return False
+        self.index.remove(task_id)
+        runner = self._running.get(task_id)
+        if runner is not None:
+            runner.cancel()
+        self._interrupted.discard(task_id)
+        self.listeners.pop(task_id, None)
+        queue = self.stream_queues.pop(task_id, None)
+        if queue is not None:
+            queue.put_nowait(None)  # Ends a stream still reading it
+        if self.persistence_layer:
+            self._in_background(self.persistence_layer.delete_task(task_id))
+        return True
+
+    def evict_expired(self) -> int:
+        """Remove finished tasks that are older than the retention period.
+
+        Only tasks in a terminal state are evicted, found through the state
+        index oldest first, so the cost grows with the number evicted.
+
+        Returns:
+            Number of tasks evicted
+        """
+        if self.retention <= 0:
+            return 0
+        cutoff = datetime.utcnow() - timedelta(seconds=self.retention)
+        expired = [
+            task_id
+            for state in TERMINAL_STATES
+            for task_id in self.index.updated_before(state, cutoff)
+        ]
+        for task_id in expired:
+            self.remove_task(task_id)
+        if expired:
+            logger.info(f"Evicted {len(expired)} expired task(s)")
+        return len(expired)
+
+    async def run_eviction(self, interval: float) -> None:
+        """Evict expired tasks periodically until cancelled.
+
+        Args:
+            interval: Seconds between eviction passes
+        """
+        while True:
+            await asyncio.sleep(interval)
+            self.evict_expired()
 
     def get_or_create_stream_queue(self, task_id: str) -> asyncio.Queue:
-        """Get or create a queue for streaming updates."""
+        """Get or create a queue for streaming updates.
+
+        Queues exist only while a subscriber reads them; events published
+        before it connects are covered by the task snapshot it starts with.
+        """
         if task_id not in self.stream_queues:
             self.stream_queues[task_id] = asyncio.Queue()
         return self.stream_queues[task_id]
@@ -139,32 +454,258 @@ class TaskManager:
         if task_id in self.stream_queues:
             del self.stream_queues[task_id]
 
-    async def _process_task_async(self, task: Task) -> None:
-        """Process a task asynchronously."""
-        queue = self.get_or_create_stream_queue(task.id)
+    def add_listener(self, task_id: str, listener: TaskListener) -> None:
+        """Register a callback for events published on a task.
 
-        try:
-            # Update to processing
-            await asyncio.sleep(1)
-            task.state = TaskState.PROCESSING
-            await queue.put({"state": task.state})
-
-            # Simulate incremental processing
-            await asyncio.sleep(1)
-            parts = [{"type": "text", "text": "Processing task..."}]
-            await queue.put({"partialMessage": {"role": "agent", "parts": parts}})
-
-            # Final result
-            await asyncio.sleep(1)
-            parts = [{"type": "text", "text": "Task completed successfully"}]
-            response_message = Message(role="agent", parts=parts)
-            task.messages.append(response_message)
-            task.state = TaskState.COMPLETED
+        Args:
+            task_id: ID of the task to follow
+            listener: Callback invoked with (task_id, event); must not block
+        """
+        self.listeners.setdefault(task_id, set()).add(listener)
+
+    def remove_listener(self, task_id: str, listener: TaskListener) -> None:
+        """Unregister a task event callback.
+
+        Args:
+            task_id: ID of the followed task
+            listener: The callback passed to add_listener
+        """
+        listeners = self.listeners.get(task_id)
+        if listeners is not None:
+            listeners.discard(listener)
+            if not listeners:
+                del self.listeners[task_id]
+
+    def _to_message(self, message: Any) -> Message:
+        """Return a Message, validating it only if it is still a raw dict.
+
+        Args:
+            message: A Message already validated by the dispatcher, or a dict
+
+        Returns:
+            The message model
+        """
+        if isinstance(message, Message):
+            return message
+        return Message(**message)
+
+    def _parse_push_config(
+        self, params: Dict[str, Any]
+    ) -> Optional[PushNotificationConfig]:
+        """Validate the optional push notification config of a task request.
+
+        Args:
+            params: Task parameters
+
+        Returns:
+            The parsed config, or None if the client did not provide one
+
+        Raises:
+            ValueError: If the config is malformed
+        """
+        data = params.get("pushNotification")
+        if data is None:
+            return None
+        config = PushNotificationConfig.model_validate(data)
+        if not config.url.startswith(("http://", "https://")):
+            raise ValueError("pushNotification.url must be an http(s) URL")
+        if self.push_sender is not None:
+            self.push_sender.policy.check_url(config.url)
+        return config
+
+    def _start(self, task: Task, coro: Awaitable[Any]) -> asyncio.Task:
+        """Run task processing in the background, tracked for shutdown.
+
+        Args:
+            task: The task being processed
+            coro: The processing coroutine
+
+        Returns:
+            The asyncio task running the coroutine
+        """
+        runner = asyncio.ensure_future(coro)
+        self._running[task.id] = runner
+
+        def forget(_: asyncio.Task) -> None:
+            if self._running.get(task.id) is runner:
+                del self._running[task.id]
+
+        runner.add_done_callback(forget)
+        return runner
+
+    def _flush_output(self, task: Task) -> None:
+        """Bring a task's streaming response message up to date for readers."""
+        builder = self._builders.get(task.id)
+        if builder is not None:
+            builder.flush()
+
+    def _add_task(self, task: Task) -> None:
+        """Store a new or restored task and index it."""
+        self.tasks[task.id] = task
+        self.index.add(task)
+
+    def _transition(
+        self, task: Task, state: TaskState, error: Optional[str] = None
+    ) -> None:
+        """Move a task to a new state, re-index it, and checkpoint it once done.
+
+        Args:
+            task: The task to update
+            state: The new state
+            error: Error description for failed tasks
+        """
+        task.state = state
+        task.updated_at = datetime.utcnow()
+        if error is not None:
+            task.error = error
+        self.index.add(task)
+        if state in TERMINAL_STATES:
+            self._save_task(task)
+
+    def _save_task(self, task: Task) -> None:
+        """Persist a task in the background, if persistence is enabled.
+
+        The persistence layer writes in submission order, so a later save
+        always wins over an earlier one.
+
+        Args:
+            task: The task to save
+        """
+        if self.persistence_layer:
+            self._in_background(self.persistence_layer.save_task(task))
+
+    def _in_background(self, write: Awaitable[None]) -> None:
+        """Run a persistence write without waiting for it.
+
+        Args:
+            write: The persistence layer call
+        """
+        future = asyncio.ensure_future(write)
+        self._pending_writes.add(future)
+        future.add_done_callback(self._on_written)
+
+    def _on_written(self, write: asyncio.Task) -> None:
+        """Forget a finished background write and log its failure."""
+        self._pending_writes.discard(write)
+        if not write.cancelled() and write.exception() is not None:
+            logger.error(f"Failed to persist task: {write.exception()}")
+
+    def _publish(self, task: Task, event: Dict[str, Any]) -> None:
+        """Deliver a task event to its stream subscribers, listeners and webhook.
+
+        Args:
+            task: The task the event belongs to
+            event: The event payload
+        """
+        queue = self.stream_queues.get(task.id)
+        if queue is not None:
+            queue.put_nowait(event)
+        # Copy, since listeners may unsubscribe themselves on terminal events
+        for listener in tuple(self.listeners.get(task.id, ())):
+            listener(task.id, event)
+        # Webhooks get state changes only, not every streamed chunk
+        if self.push_sender and task.push_notification and "state" in event:
+            self.push_sender.notify(task.push_notification, task.id, event)
 
-            await queue.put({"state": task.state, "message": response_message.dict()})
+    def _create_deadline(self, params: Dict[str, Any]) -> Deadline:
+        """Create the execution deadline for a task.
 
-        except Exception as e:
-            logger.error(f"Error processing task {task.id}: {e}")
-            task.state = TaskState.FAILED
-            task.error = str(e)
-            await queue.put({"state": task.state, "error": task.error})
+        Args:
+            params: Task parameters, optionally carrying a client "timeout"
+
+        Returns:
+            Deadline clamped to the server maximum
+        """
+        timeout = resolve_timeout(
+            params.get("timeout"), self.default_timeout, self.max_timeout
+        )
+        return Deadline(timeout)
+
+    def _timeout_error(self, deadline: Deadline) -> str:
+        """Build the error message for a task that exceeded its deadline."""
+        return f"Task timed out after {deadline.timeout:g}s"
+
+    def _fail_task(self, task: Task, error: str) -> None:
+        """Move a task to the FAILED state and notify stream subscribers.
+
+        Args:
+            task: The task that failed
+            error: Human readable error description
+        """
+        logger.error(f"Error processing task {task.id}: {error}")
+        self._transition(task, TaskState.FAILED, error)
+        self._publish(task, {"state": task.state, "error": task.error})
+
+    async def _run_with_deadline(
+        self, task: Task, deadline: Deadline
+    ) -> Optional[Message]:
+        """Run task processing bounded by its deadline.
+
+        Args:
+            task: The task to process
+            deadline: Deadline propagated to everything the task awaits
+
+        Returns:
+            The agent's response message, or None if the task failed
+        """
+        with deadline_scope(deadline):
+            try:
+                return await asyncio.wait_for(
+                    self._tracked(task, self._process_task(task)),
+                    timeout=deadline.remaining(),
+                )
+            except asyncio.TimeoutError:
+                self._fail_task(task, self._timeout_error(deadline))
+            except Exception as e:
+                self._fail_task(task, str(e))
+        return None
+
+    async def _tracked(self, task: Task, coro: Awaitable[T]) -> T:
+        """Await task processing labelled for event-loop diagnostics."""
+        with track(f"task:{task.id}"):
+            return await coro
+
+    async def _process_task(self, task: Task) -> Message:
+        """Run a task through its handler and return the agent's response.
+
+        Partial output of streaming handlers is published as it arrives and
+        appended to a single response message on the task.
+
+        Args:
+            task: The task to process
+
+        Returns:
+            The agent's response message
+        """
+        handler = self.handlers.resolve(task)
+        self._transition(task, TaskState.PROCESSING)
+        self._publish(task, {"state": task.state})
+
+        output = handler(task)
+        if hasattr(output, "__aiter__"):
+            response_message = Message(role="agent", parts=[])
+            task.messages.append(response_message)
+            builder = MessageBuilder(response_message)
+            self._builders[task.id] = builder
+            try:
+                async for chunk in output:
+                    parts = to_parts(chunk)
+                    builder.append(parts)
+                    self._publish(
+                        task, {"partialMessage": {"role": "agent", "parts": parts}}
+                    )
+            finally:
+                builder.flush()
+                if self._builders.get(task.id) is builder:
+                    del self._builders[task.id]
+        else:
+            if inspect.isawaitable(output):
+                output = await output
+            response_message = Message(role="agent", parts=to_parts(output))
+            task.messages.append(response_message)
+
+        self._transition(task, TaskState.COMPLETED)
+        self._publish(
+            task, {"state": task.state, "message": response_message.model_dump()}
+        )
+        return response_message
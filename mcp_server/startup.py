@@ -0,0 +1,166 @@
+"""Startup timing and lazy loading of optional subsystems."""
+
+import importlib
+import sys
+import time
+from contextlib import contextmanager
+from importlib.abc import MetaPathFinder
+from importlib.machinery import ModuleSpec, PathFinder
+from types import ModuleType
+from typing import Iterator, List, Optional, Tuple
+
+
+class _ModuleTimingFinder(MetaPathFinder):
+    """Meta path finder timing the execution of every module in a package.
+
+    Modules are found with the regular path finder; only their loader's
+    exec_module is wrapped, so the timings cover the module body and the
+    imports it triggers, like `python -X importtime`.
+    """
+
+    def __init__(self, timer: "StartupTimer", package: str):
+        self.timer = timer
+        self.package = package
+        # Cumulative time of the children of each module being executed
+        self._stack: List[float] = []
+
+    def covers(self, name: str) -> bool:
+        """Whether a module belongs to the timed package."""
+        return name == self.package or name.startswith(self.package + ".")
+
+    def find_spec(self, fullname, path, target=None) -> Optional[ModuleSpec]:
+        if not self.covers(fullname):
+            return None
+        spec = PathFinder.find_spec(fullname, path, target)
+        if spec is None or spec.loader is None:
+            return None
+
+        exec_module = spec.loader.exec_module
+
+        def timed_exec_module(module: ModuleType) -> None:
+            depth = len(self._stack)
+            self._stack.append(0.0)
+            start = time.perf_counter()
+            try:
+                exec_module(module)
+            finally:
+                cumulative = time.perf_counter() - start
+                children = self._stack.pop()
+                if self._stack:
+                    self._stack[-1] += cumulative
+                self.timer.modules.append(
+                    (fullname, depth, cumulative - children, cumulative)
+                )
+
+        spec.loader.exec_module = timed_exec_module
+        return spec
+
+
+class StartupTimer:
+    """Records import times and startup milestones for the debug report."""
+
+    def __init__(self):
+        """Initialize the timer; elapsed times are measured from here."""
+        self.started_at = time.perf_counter()
+        self.imports: List[Tuple[str, float]] = []
+        # (name, nesting depth, self time, cumulative time) per module
+        self.modules: List[Tuple[str, int, float, float]] = []
+        self.marks: List[Tuple[str, float]] = []
+        self._finder: Optional[_ModuleTimingFinder] = None
+
+    def elapsed(self) -> float:
+        """Return seconds since the timer was created."""
+        return time.perf_counter() - self.started_at
+
+    @contextmanager
+    def timed_import(self, name: str) -> Iterator[None]:
+        """Time the import statements executed inside the block.
+
+        Args:
+            name: Label for the report, usually the imported module
+        """
+        start = time.perf_counter()
+        yield
+        self.imports.append((name, time.perf_counter() - start))
+
+    def time_package(self, package: str) -> None:
+        """Time each module of a package as it is imported from now on.
+
+        Args:
+            package: Top-level package name, e.g. "mcp_server"
+        """
+        if self._finder is None:
+            self._finder = _ModuleTimingFinder(self, package)
+            sys.meta_path.insert(0, self._finder)
+
+    def import_module(self, name: str) -> ModuleType:
+        """Import a module by name, timing it if it was not yet loaded.
+
+        Args:
+            name: Fully qualified module name
+
+        Returns:
+            The imported module
+        """
+        module = sys.modules.get(name)
+        if module is not None:
+            return module
+        if self._finder is not None and self._finder.covers(name):
+            # Already timed module by module
+            return importlib.import_module(name)
+        with self.timed_import(name):
+            return importlib.import_module(name)
+
+    def mark(self, milestone: str) -> None:
+        """Record a startup milestone at the current elapsed time.
+
+        Args:
+            milestone: Description such as "listening"
+        """
+        self.marks.append((milestone, self.elapsed()))
+
+    def report(self) -> str:
+        """Format the startup timing report.
+
+        Import times are inclusive of dependencies that were not loaded yet.
+        Timed package modules are listed in the order they finished, each
+        indented under the module that imported it, with its self time
+        followed by its cumulative time.
+
+        Returns:
+            Multi-line report
+        """
+        lines = ["Startup timing report:", "  imports:"]
+        for name, duration in self.imports:
+            lines.append(f"    {duration * 1000:8.1f} ms  {name}")
+        if self._finder is not None:
+            lines.append(f"  {self._finder.package} modules (self, cumulative):")
+            for name, depth, own, cumulative in self.modules:
+                lines.append(
+                    f"    {own * 1000:8.1f} ms {cumulative * 1000:8.1f} ms  "
+                    f"{'  ' * depth}{name}"
+                )
+        lines.append("  milestones (since entry point):")
+        for milestone, elapsed in self.marks:
+            lines.append(f"    {elapsed * 1000:8.1f} ms  {milestone}")
+        return "\n".join(lines)
+
+
+_startup_timer = StartupTimer()
+
+
+def get_startup_timer() -> StartupTimer:
+    """Return the process-wide startup timer."""
+    return _startup_timer
+
+
+def lazy_import(name: str) -> ModuleType:
+    """Import an optional subsystem on first use and record its import time.
+
+    Args:
+        name: Fully qualified module name
+
+    Returns:
+        The imported module
+    """
+    return _startup_timer.import_module(name)
@@ -0,0 +1,61 @@
+"""Unit tests for response compression."""
+
+import gzip
+import zlib
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestClient, TestServer
+
+from mcp_server.compression import StreamCompressor, negotiate_encoding
+from mcp_server.middleware import compression_middleware
+
+
+def test_negotiate_encoding():
+    """Test Accept-Encoding negotiation."""
+    assert negotiate_encoding(None) is None
+    assert negotiate_encoding("identity") is None
+    assert negotiate_encoding("gzip, deflate") == "gzip"
+    assert negotiate_encoding("gzip;q=0") is None
+    assert negotiate_encoding("*") is not None
+
+
+def test_stream_compressor_flushes_each_event():
+    """Test that every compressed SSE chunk is decodable on its own."""
+    compressor = StreamCompressor("gzip")
+    decoder = zlib.decompressobj(16 + zlib.MAX_WBITS)
+
+    for index in range(3):
+        event = f'data: {{"n": {index}}}\n\n'.encode("utf-8")
+        assert decoder.decompress(compressor.compress(event)) == event
+
+    decoder.decompress(compressor.finish())
+    assert decoder.eof
+
+
+@pytest.mark.asyncio
+async def test_compression_middleware():
+    """Test that only large JSON responses are compressed."""
+
+    async def large(request):
+        return web.json_response({"text": "x" * 4096})
+
+    async def small(request):
+        return web.json_response({"text": "x"})
+
+    app = web.Application(middlewares=[compression_middleware])
+    app.router.add_get("/large", large)
+    app.router.add_get("/small", small)
+
+    async with TestClient(TestServer(app)) as client:
+        response = await client.get(
+            "/large", headers={"Accept-Encoding": "gzip"}, auto_decompress=False
+        )
+        assert response.headers["Content-Encoding"] == "gzip"
+        body = gzip.decompress(await response.read())
+        assert body.startswith(b'{"text": "xxx')
+
+        response = await client.get(
+            "/small", headers={"Accept-Encoding": "gzip"}, auto_decompress=False
+        )
+        assert "Content-Encoding" not in response.headers
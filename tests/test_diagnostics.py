@@ -0,0 +1,98 @@
+"""Unit tests for event-loop diagnostics."""
+
+import asyncio
+import time
+
+import pytest
+from aiohttp.test_utils import TestClient, TestServer
+
+from mcp_server.app import create_app
+from mcp_server.config import get_settings
+from mcp_server.services.diagnostics import LoopDiagnostics
+from mcp_server.services.task_labels import track
+
+
+def _block(seconds):
+    time.sleep(seconds)
+
+
+@pytest.mark.asyncio
+async def test_slow_callback_is_recorded_with_context():
+    """Test that a blocking call is captured with its stack and label."""
+    diagnostics = LoopDiagnostics(interval=0.01, slow_threshold=0.05)
+    await diagnostics.start()
+    try:
+        await asyncio.sleep(0.05)
+        with track("POST /"):
+            _block(0.3)
+        await asyncio.sleep(0.05)
+    finally:
+        await diagnostics.stop()
+
+    report = diagnostics.snapshot()
+    assert report["lag"]["max"] >= 0.25
+    stall = report["slowCallbacks"][0]
+    assert stall["context"] == "POST /"
+    assert stall["duration"] >= 0.25
+    assert any("_block" in line for line in stall["stack"])
+
+
+@pytest.mark.asyncio
+async def test_profile_samples_loop_thread():
+    """Test that the sampling profiler aggregates loop-thread stacks."""
+    diagnostics = LoopDiagnostics(interval=0.01, slow_threshold=1)
+    await diagnostics.start()
+    try:
+        assert diagnostics.start_profile(0.1, sample_interval=0.005)
+        assert not diagnostics.start_profile(0.1)
+        _block(0.15)
+        await asyncio.sleep(0.05)
+    finally:
+        await diagnostics.stop()
+
+    profile = diagnostics.last_profile
+    assert profile["samples"] > 0
+    assert "_block" in profile["stacks"][0]["stack"]
+
+
+@pytest.mark.asyncio
+async def test_admin_endpoints_require_token(monkeypatch):
+    """Test that admin endpoints need a configured token and present it."""
+    settings = get_settings()
+    monkeypatch.setattr(settings, "diagnostics_enabled", True)
+    monkeypatch.setattr(settings, "admin_token", "")
+    app = await create_app()
+    async with TestClient(TestServer(app)) as client:
+        response = await client.get("/admin/diagnostics")
+        assert response.status == 404
+
+    monkeypatch.setattr(settings, "admin_token", "s3cret")
+    app = await create_app()
+    async with TestClient(TestServer(app)) as client:
+        response = await client.get("/admin/diagnostics")
+        assert response.status == 401
+        response = await client.get(
+            "/admin/diagnostics", headers={"Authorization": "Bearer wrong"}
+        )
+        assert response.status == 401
+        response = await client.get(
+            "/admin/diagnostics", headers={"Authorization": "Bearer s3cret"}
+        )
+        assert response.status == 200
+
+
+@pytest.mark.asyncio
+async def test_profile_rejects_non_finite_parameters(monkeypatch):
+    """Test that NaN and infinite profile parameters are rejected."""
+    settings = get_settings()
+    monkeypatch.setattr(settings, "diagnostics_enabled", True)
+    monkeypatch.setattr(settings, "admin_token", "s3cret")
+    app = await create_app()
+    headers = {"Authorization": "Bearer s3cret"}
+    async with TestClient(TestServer(app)) as client:
+        for query in ("duration=nan", "interval=nan", "interval=inf"):
+            response = await client.post(
+                f"/admin/diagnostics/profile?{query}", headers=headers
+            )
+            assert response.status == 400
+        assert not app["diagnostics"].profiling
@@ -0,0 +1,27 @@
+"""Unit tests for the health and readiness endpoints."""
+
+import asyncio
+
+import pytest
+from aiohttp.test_utils import TestClient, TestServer
+
+from mcp_server.app import create_app
+
+
+@pytest.mark.asyncio
+async def test_readiness_follows_warmup():
+    """Test that /ready is separate from /health and tracks readiness."""
+    app = await create_app()
+    async with TestClient(TestServer(app)) as client:
+        await asyncio.wait_for(app["warm_up_task"], timeout=5)
+
+        response = await client.get("/ready")
+        assert response.status == 200
+
+        app["readiness"].mark_not_ready("shutting down")
+        response = await client.get("/ready")
+        assert response.status == 503
+        assert (await response.json())["reason"] == "shutting down"
+
+        response = await client.get("/health")
+        assert response.status == 200
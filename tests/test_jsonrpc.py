@@ -0,0 +1,102 @@
+"""Unit tests for the JSON-RPC method registry."""
+
+import json
+
+import pytest
+from pydantic import BaseModel
+
+from mcp_server.api.jsonrpc import MethodRegistry
+
+
+class EchoParams(BaseModel):
+    text: str
+    repeat: int = 1
+
+
+class OptionalParams(BaseModel):
+    limit: int = 10
+
+
+@pytest.fixture
+def registry():
+    """Returns a registry with a plugin-style echo method."""
+    registry = MethodRegistry()
+
+    @registry.method("plugin/echo", EchoParams)
+    async def echo(request_id, params, context):
+        return {"id": request_id, "result": {"text": params.text * params.repeat}}
+
+    @registry.method("plugin/context", EchoParams)
+    async def context_value(request_id, params, context):
+        return {"id": request_id, "result": {"value": context.get("value")}}
+
+    @registry.method("plugin/optional", OptionalParams)
+    async def optional(request_id, params, context):
+        return {"id": request_id, "result": {"limit": params.limit}}
+
+    registry.build()
+    return registry
+
+
+def _raw(method, params, request_id=1):
+    return json.dumps(
+        {"jsonrpc": "2.0", "id": request_id, "method": method, "params": params}
+    ).encode("utf-8")
+
+
+@pytest.mark.asyncio
+async def test_dispatch_registered_method(registry):
+    """Test that a registered method receives validated params."""
+    response = await registry.dispatch(_raw("plugin/echo", {"text": "ab", "repeat": 2}))
+    assert response == {"jsonrpc": "2.0", "id": 1, "result": {"text": "abab"}}
+
+    response = await registry.dispatch(
+        _raw("plugin/context", {"text": "x"}), {"value": 42}
+    )
+    assert response["result"] == {"value": 42}
+
+
+@pytest.mark.asyncio
+async def test_dispatch_errors(registry):
+    """Test the JSON-RPC error codes for malformed requests."""
+    response = await registry.dispatch(b"{not json")
+    assert response["error"]["code"] == -32700
+
+    response = await registry.dispatch(_raw("plugin/missing", {}, request_id=7))
+    assert response["id"] == 7
+    assert response["error"]["code"] == -32601
+
+    response = await registry.dispatch(_raw("plugin/echo", {"repeat": "x"}))
+    assert response["error"]["code"] == -32602
+
+    response = await registry.dispatch(b"[]")
+    assert response["error"]["code"] == -32600
+
+
+@pytest.mark.asyncio
+async def test_params_may_be_omitted(registry):
+    """Test that params are optional for methods without required params."""
+    response = await registry.dispatch(
+        b'{"jsonrpc": "2.0", "id": 1, "method": "plugin/optional"}'
+    )
+    assert response["result"] == {"limit": 10}
+
+    response = await registry.dispatch(
+        b'{"jsonrpc": "2.0", "id": 2, "method": "plugin/echo"}'
+    )
+    assert response["error"]["code"] == -32602
+
+
+@pytest.mark.asyncio
+async def test_register_after_build(registry):
+    """Test that methods registered after startup are picked up."""
+
+    async def late(request_id, params, context):
+        return {"id": request_id, "result": {}}
+
+    registry.register("plugin/late", EchoParams, late)
+    response = await registry.dispatch(_raw("plugin/late", {"text": ""}))
+    assert response["result"] == {}
+
+    with pytest.raises(ValueError):
+        registry.register("plugin/late", EchoParams, late)
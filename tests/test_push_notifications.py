@@ -0,0 +1,249 @@
+"""Unit tests for webhook push notifications."""
+
+import asyncio
+import json
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from mcp_server.app import create_app
+from mcp_server.config import get_settings
+from mcp_server.models.request import SendTaskRequest
+from mcp_server.models.task import PushNotificationConfig, TaskState
+from mcp_server.services.persistence import FilePersistenceLayer
+from mcp_server.services.push_notifications import (
+    SIGNATURE_HEADER,
+    TIMESTAMP_HEADER,
+    DestinationPolicy,
+    PushNotificationSender,
+    sign_payload,
+)
+from mcp_server.services.task_manager import TaskManager
+
+# The webhook stubs listen on loopback, which is blocked by default
+LOCAL = DestinationPolicy(["127.0.0.0/8"])
+
+
+class WebhookStub:
+    """Local HTTP server recording webhook deliveries."""
+
+    def __init__(self, failures: int = 0, status: int = 503):
+        self.failures = failures
+        self.status = status
+        self.deliveries = []
+        self.received = asyncio.Event()
+        app = web.Application()
+        app.router.add_post("/hook", self.handle)
+        self.server = TestServer(app)
+
+    async def handle(self, request):
+        if self.failures > 0:
+            self.failures -= 1
+            return web.Response(status=self.status)
+        body = await request.read()
+        self.deliveries.append((dict(request.headers), body))
+        self.received.set()
+        return web.Response(status=204)
+
+    @property
+    def url(self):
+        return str(self.server.make_url("/hook"))
+
+
+@pytest.mark.asyncio
+async def test_events_are_batched_and_signed():
+    """Test that events within the batch window share one signed POST."""
+    stub = WebhookStub()
+    await stub.server.start_server()
+    sender = PushNotificationSender(
+        signing_secret="secret", batch_window=0.05, policy=LOCAL
+    )
+    await sender.start()
+    try:
+        config = PushNotificationConfig(url=stub.url)
+        sender.notify(config, "task-1", {"state": TaskState.PROCESSING})
+        sender.notify(config, "task-1", {"state": TaskState.COMPLETED})
+        await asyncio.wait_for(stub.received.wait(), timeout=2)
+    finally:
+        await sender.close()
+        await stub.server.close()
+
+    assert len(stub.deliveries) == 1
+    headers, body = stub.deliveries[0]
+    events = json.loads(body)["events"]
+    assert [e["state"] for e in events] == ["processing", "completed"]
+    expected = sign_payload("secret", headers[TIMESTAMP_HEADER], body)
+    assert headers[SIGNATURE_HEADER] == expected
+
+
+@pytest.mark.asyncio
+async def test_failed_delivery_is_retried():
+    """Test that a failed batch is retried with backoff until it succeeds."""
+    stub = WebhookStub(failures=2)
+    await stub.server.start_server()
+    sender = PushNotificationSender(
+        batch_window=0.01, retry_base_delay=0.01, policy=LOCAL
+    )
+    await sender.start()
+    try:
+        config = PushNotificationConfig(url=stub.url, token="client-token")
+        sender.notify(config, "task-1", {"state": TaskState.COMPLETED})
+        await asyncio.wait_for(stub.received.wait(), timeout=2)
+    finally:
+        await sender.close()
+        await stub.server.close()
+
+    assert len(stub.deliveries) == 1
+    assert sender.pending_retries == 0
+    # The client token is not a signing key
+    assert SIGNATURE_HEADER not in stub.deliveries[0][0]
+
+
+@pytest.mark.asyncio
+async def test_rejected_delivery_is_not_retried():
+    """Test that a 4xx other than 408 and 429 drops the batch."""
+    stub = WebhookStub(failures=1, status=404)
+    await stub.server.start_server()
+    sender = PushNotificationSender(
+        batch_window=0.01, retry_base_delay=0.01, policy=LOCAL
+    )
+    await sender.start()
+    try:
+        config = PushNotificationConfig(url=stub.url)
+        sender.notify(config, "task-1", {"state": TaskState.COMPLETED})
+        await asyncio.sleep(0.2)
+    finally:
+        await sender.close()
+        await stub.server.close()
+
+    assert stub.failures == 0
+    assert stub.deliveries == []
+    assert sender.pending_retries == 0
+
+
+@pytest.mark.asyncio
+async def test_task_manager_sends_push_notifications():
+    """Test that task state changes reach the configured webhook."""
+    stub = WebhookStub()
+    await stub.server.start_server()
+    sender = PushNotificationSender(batch_window=0.01, policy=LOCAL)
+    await sender.start()
+    task_manager = TaskManager(push_sender=sender)
+    try:
+        request = SendTaskRequest(
+            id="req-1",
+            params={
+                "id": "task-1",
+                "message": {
+                    "role": "user",
+                    "parts": [{"type": "text", "text": "streamed to the client"}],
+                },
+                "pushNotification": {"url": stub.url},
+            },
+        )
+        await task_manager.on_send_task(request)
+        await asyncio.wait_for(stub.received.wait(), timeout=2)
+    finally:
+        await sender.close()
+        await stub.server.close()
+
+    events = [
+        event for _, body in stub.deliveries for event in json.loads(body)["events"]
+    ]
+    assert events[-1]["taskId"] == "task-1"
+    # Partial output of the streaming handler is not pushed
+    assert [event["state"] for event in events] == ["processing", "completed"]
+
+
+@pytest.mark.asyncio
+async def test_invalid_push_config_is_rejected():
+    """Test that a non-HTTP webhook URL is rejected as invalid params."""
+    task_manager = TaskManager()
+    request = SendTaskRequest(
+        id="req-1",
+        params={
+            "id": "task-1",
+            "message": {"role": "user", "parts": []},
+            "pushNotification": {"url": "file:///etc/passwd"},
+        },
+    )
+    response = await task_manager.on_send_task(request)
+    assert response.error["code"] == -32602
+    assert task_manager.get_task("task-1") is None
+
+
+@pytest.mark.asyncio
+async def test_private_destinations_are_blocked():
+    """Test that webhooks cannot target loopback or internal addresses."""
+    task_manager = TaskManager(push_sender=PushNotificationSender())
+    for url in (
+        "http://127.0.0.1:8080/hook",
+        "http://localhost/hook",
+        "http://169.254.169.254/latest/meta-data",
+        "http://[::ffff:10.0.0.1]/hook",
+    ):
+        request = SendTaskRequest(
+            id="req-1",
+            params={
+                "id": "task-1",
+                "message": {"role": "user", "parts": []},
+                "pushNotification": {"url": url},
+            },
+        )
+        response = await task_manager.on_send_task(request)
+        assert response.error["code"] == -32602, url
+
+    policy = DestinationPolicy(["10.0.0.0/8"])
+    assert policy.is_allowed("10.1.2.3")
+    assert not policy.is_allowed("192.168.0.1")
+    assert policy.is_allowed("93.184.216.34")
+
+    # Host names are checked when they resolve
+    stub = WebhookStub()
+    await stub.server.start_server()
+    sender = PushNotificationSender(batch_window=0.01)
+    await sender.start()
+    try:
+        url = stub.url.replace("127.0.0.1", "localhost.")
+        assert not await sender._deliver(url, None, [{"taskId": "task-1"}])
+    finally:
+        await sender.close()
+        await stub.server.close()
+    assert stub.deliveries == []
+
+
+@pytest.mark.asyncio
+async def test_push_token_is_only_persisted(tmp_path):
+    """Test that the webhook token is never serialized for API clients."""
+    persistence_layer = FilePersistenceLayer(str(tmp_path))
+    task_manager = TaskManager(persistence_layer=persistence_layer)
+    request = SendTaskRequest(
+        id="req-1",
+        params={
+            "id": "task-1",
+            "message": {"role": "user", "parts": [{"type": "text", "text": "Hi"}]},
+            "pushNotification": {"url": "https://example.com/hook", "token": "t0k"},
+        },
+    )
+    await task_manager.on_send_task(request)
+    await task_manager.shutdown(timeout=1)
+
+    task = task_manager.get_task("task-1")
+    assert "token" not in task.model_dump(mode="json")["push_notification"]
+    restored = await persistence_layer.load_tasks()
+    assert restored[0].push_notification.token == "t0k"
+
+
+@pytest.mark.asyncio
+async def test_push_requires_signing_secret(monkeypatch):
+    """Test that push notifications stay off without a signing secret."""
+    settings = get_settings()
+    monkeypatch.setattr(settings, "push_notifications_enabled", True)
+    monkeypatch.setattr(settings, "push_signing_secret", "")
+    app = await create_app()
+    assert app["push_sender"] is None
+
+    monkeypatch.setattr(settings, "push_signing_secret", "secret")
+    app = await create_app()
+    assert app["push_sender"] is not None
@@ -0,0 +1,133 @@
+"""Unit tests for the task scheduler."""
+
+import asyncio
+import json
+import time
+
+import pytest
+
+from mcp_server.api.handlers.scheduler import SchedulerHandler
+from mcp_server.api.jsonrpc import MethodRegistry
+from mcp_server.services.persistence import FilePersistenceLayer
+from mcp_server.services.scheduler import TaskScheduler
+from mcp_server.services.task_handlers import HandlerRegistry
+from mcp_server.services.task_manager import TaskManager
+
+
+def _params(task_id, session_id=None):
+    return {
+        "id": task_id,
+        "sessionId": session_id,
+        "message": {"role": "user", "parts": [{"type": "text", "text": "Hi"}]},
+    }
+
+
+class RecordingHandler:
+    """Handler recording the order tasks run in."""
+
+    def __init__(self, expected: int):
+        self.order = []
+        self.expected = expected
+        self.done = asyncio.Event()
+
+    async def __call__(self, task):
+        self.order.append(task.id)
+        if len(self.order) == self.expected:
+            self.done.set()
+        return "ok"
+
+
+@pytest.mark.asyncio
+async def test_fair_share_and_priority():
+    """Test that sessions take turns and priority orders a session's tasks."""
+    handler = RecordingHandler(expected=6)
+    task_manager = TaskManager(handlers=HandlerRegistry(handler))
+    scheduler = TaskScheduler(task_manager, concurrency=1)
+
+    for index in range(4):
+        scheduler.schedule(_params(f"bulk-{index}", "bulk"))
+    scheduler.schedule(_params("bulk-urgent", "bulk"), priority=10)
+    scheduler.schedule(_params("interactive", "chat"))
+
+    await scheduler.start()
+    await asyncio.wait_for(handler.done.wait(), timeout=5)
+    await scheduler.close()
+
+    assert handler.order[:3] == ["bulk-urgent", "interactive", "bulk-0"]
+    assert scheduler.pending == 0
+
+
+@pytest.mark.asyncio
+async def test_recurring_and_persisted_schedule(tmp_path):
+    """Test recurring runs, and that pending entries survive a restart."""
+    persistence_layer = FilePersistenceLayer(str(tmp_path))
+    handler = RecordingHandler(expected=3)
+    task_manager = TaskManager(handlers=HandlerRegistry(handler))
+    scheduler = TaskScheduler(task_manager, persistence_layer=persistence_layer)
+    methods = MethodRegistry()
+    SchedulerHandler(scheduler, methods)
+    await scheduler.start()
+
+    async def call(method, params):
+        request = {"jsonrpc": "2.0", "id": 1, "method": method, "params": params}
+        return await methods.dispatch(json.dumps(request))
+
+    response = await call("tasks/schedule", {**_params("tick"), "interval": 0.05})
+    assert response["result"]["interval"] == 0.05
+    await asyncio.wait_for(handler.done.wait(), timeout=5)
+    assert handler.order[:3] == ["tick:1", "tick:2", "tick:3"]
+    assert (await call("tasks/unschedule", {"id": "tick"}))["result"]["ok"]
+
+    later = time.time() + 3600
+    push = {"url": "https://example.com/hook", "token": "t0k"}
+    nightly = {**_params("nightly"), "runAt": later, "pushNotification": push}
+    await call("tasks/schedule", {**nightly, "priority": -1})
+    await scheduler.close()
+
+    restarted = TaskScheduler(task_manager, persistence_layer=persistence_layer)
+    await restarted.start()
+    entry = restarted.get("nightly")
+    assert entry["runAt"] == pytest.approx(later)
+    assert entry["priority"] == -1
+    assert entry["params"]["pushNotification"] == push
+    assert restarted.get("tick") is None
+    await restarted.close()
+
+
+@pytest.mark.asyncio
+async def test_unroutable_and_failed_runs():
+    """Test that unknown skills are rejected and failed runs are recorded."""
+    handlers = HandlerRegistry(lambda task: 1 / 0)
+    task_manager = TaskManager(handlers=handlers)
+    scheduler = TaskScheduler(task_manager)
+    methods = MethodRegistry()
+    SchedulerHandler(scheduler, methods)
+
+    async def call(method, params):
+        request = {"jsonrpc": "2.0", "id": 1, "method": method, "params": params}
+        return await methods.dispatch(json.dumps(request))
+
+    response = await call("tasks/schedule", {**_params("lost"), "skill": "missing"})
+    assert response["error"]["code"] == -32602
+    assert scheduler.get("lost") is None
+    for interval in ("nan", "inf"):
+        params = {**_params("endless"), "interval": interval}
+        response = await call("tasks/schedule", params)
+        assert response["error"]["code"] == -32602
+    assert scheduler.get("endless") is None
+
+    await call("tasks/schedule", _params("crash"))
+    bad_push = {**_params("bad-push"), "pushNotification": {"url": "file:///x"}}
+    await call("tasks/schedule", bad_push)
+    await scheduler.start()
+    for schedule_id in ("crash", "bad-push"):
+        while not (scheduler.get(schedule_id) or {}).get("failedRuns"):
+            await asyncio.sleep(0.01)
+    await scheduler.close()
+
+    result = (await call("tasks/getSchedule", {"id": "crash"}))["result"]
+    assert result["runAt"] is None
+    assert result["failedRuns"][0]["taskId"] == "crash"
+    assert "division by zero" in result["failedRuns"][0]["error"]
+    result = (await call("tasks/getSchedule", {"id": "bad-push"}))["result"]
+    assert "pushNotification" in result["failedRuns"][0]["error"]
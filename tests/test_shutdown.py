@@ -0,0 +1,79 @@
+"""Unit tests for graceful shutdown."""
+
+import asyncio
+import pytest
+from aiohttp import WSCloseCode
+from aiohttp.test_utils import TestClient, TestServer
+
+from mcp_server.app import create_app
+from mcp_server.models.request import SendTaskRequest, SubscribeTaskRequest
+from mcp_server.models.task import TaskState
+from mcp_server.services.persistence import FilePersistenceLayer
+from mcp_server.services.task_handlers import EchoHandler, HandlerRegistry
+from mcp_server.services.task_manager import TaskManager
+
+
+def _params(task_id):
+    return {
+        "id": task_id,
+        "message": {"role": "user", "parts": [{"type": "text", "text": "Hi"}]},
+    }
+
+
+@pytest.mark.asyncio
+async def test_shutdown_checkpoints_and_resumes(tmp_path):
+    """Test that a task interrupted by shutdown resumes in a new TaskManager."""
+    persistence_layer = FilePersistenceLayer(str(tmp_path))
+    first = TaskManager(
+        persistence_layer=persistence_layer,
+        handlers=HandlerRegistry(EchoHandler(delay=1)),
+    )
+    await first.on_subscribe_task(
+        SubscribeTaskRequest(id="req-1", params=_params("task-1"))
+    )
+
+    assert await first.shutdown(timeout=0.01) == ["task-1"]
+    response = await first.on_send_task(
+        SendTaskRequest(id="req-2", params=_params("task-2"))
+    )
+    assert response.error["message"] == "Server is shutting down"
+
+    second = TaskManager(persistence_layer=persistence_layer)
+    assert await second.restore() == 1
+    assert await second.shutdown(timeout=10) == []
+    task = second.get_task("task-1")
+    assert task.state == TaskState.COMPLETED
+    # The partial response of the interrupted run is not kept
+    assert [message.role for message in task.messages] == ["user", "agent"]
+    assert task.messages[-1].parts == [{"type": "text", "text": "Hi"}]
+
+    # The completed state was persisted, so a third start resumes nothing
+    third = TaskManager(persistence_layer=persistence_layer)
+    await third.restore()
+    assert not third._running
+
+
+@pytest.mark.asyncio
+async def test_streams_told_to_reconnect():
+    """Test that SSE and WebSocket clients get a reconnect notice."""
+    app = await create_app()
+    app["task_manager"].handlers.default = EchoHandler(delay=1)
+    async with TestClient(TestServer(app)) as client:
+        ws = await client.ws_connect("/ws")
+        await app["task_manager"].on_subscribe_task(
+            SubscribeTaskRequest(id="req-3", params=_params("task-3"))
+        )
+        stream = await client.get(
+            "/tasks/task-3/stream", headers={"Accept-Encoding": "identity"}
+        )
+        await stream.content.readuntil(b"\n\n")  # initial task snapshot
+
+        await app.shutdown()
+
+        body = await asyncio.wait_for(stream.content.read(), timeout=5)
+        assert body.startswith(b"event: reconnect\nretry: 1000\n")
+
+        message = await ws.receive_json(timeout=5)
+        assert message["method"] == "server/reconnect"
+        closing = await ws.receive(timeout=5)
+        assert closing.data == WSCloseCode.SERVICE_RESTART
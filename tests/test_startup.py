@@ -0,0 +1,30 @@
+"""Unit tests for startup timing."""
+
+import sys
+
+from mcp_server.startup import StartupTimer
+
+
+def test_package_modules_are_timed(tmp_path, monkeypatch):
+    """Test that each module of a timed package is reported."""
+    package = tmp_path / "timed_pkg"
+    package.mkdir()
+    (package / "__init__.py").write_text("")
+    (package / "child.py").write_text("VALUE = 1\n")
+    (package / "parent.py").write_text("from timed_pkg import child\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    timer = StartupTimer()
+    timer.time_package("timed_pkg")
+    try:
+        import timed_pkg.parent  # noqa: F401
+    finally:
+        sys.meta_path.remove(timer._finder)
+        for name in ("timed_pkg", "timed_pkg.child", "timed_pkg.parent"):
+            sys.modules.pop(name, None)
+
+    modules = {name: (depth, own, total) for name, depth, own, total in timer.modules}
+    assert set(modules) == {"timed_pkg", "timed_pkg.child", "timed_pkg.parent"}
+    assert modules["timed_pkg.child"][0] == modules["timed_pkg.parent"][0] + 1
+    assert modules["timed_pkg.parent"][2] >= modules["timed_pkg.child"][2]
+    assert "timed_pkg.child" in timer.report()
@@ -0,0 +1,105 @@
+"""Unit tests for task handlers and incremental output."""
+
+import asyncio
+
+import pytest
+
+from mcp_server.models.request import SendTaskRequest
+from mcp_server.models.task import Message, TaskState
+from mcp_server.services.deadline import current_deadline, remaining_timeout
+from mcp_server.services.task_handlers import (
+    EchoHandler,
+    HandlerRegistry,
+    MessageBuilder,
+)
+from mcp_server.services.task_manager import TaskManager
+
+
+def _request(task_id, text="Hello streaming world", **params):
+    return SendTaskRequest(
+        id="req-1",
+        params={
+            "id": task_id,
+            "message": {"role": "user", "parts": [{"type": "text", "text": text}]},
+            **params,
+        },
+    )
+
+
+def test_message_builder_merges_adjacent_text():
+    """Test that text chunks merge until a non-text part interrupts them."""
+    message = Message(role="agent", parts=[])
+    builder = MessageBuilder(message)
+    builder.append([{"type": "text", "text": "Hel"}])
+    builder.append([{"type": "text", "text": "lo"}, {"type": "text", "text": "!"}])
+    builder.append([{"type": "data", "data": {"n": 1}}])
+    builder.append([{"type": "text", "text": "a"}, {"type": "text", "text": "b"}])
+
+    assert builder.flush().parts == [
+        {"type": "text", "text": "Hello!"},
+        {"type": "data", "data": {"n": 1}},
+        {"type": "text", "text": "ab"},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_streaming_handler_output():
+    """Test that partial output is published and appended to one message."""
+    task_manager = TaskManager()
+    events = []
+    task_manager.add_listener("task-1", lambda task_id, event: events.append(event))
+
+    response = await task_manager.on_send_task(_request("task-1"))
+
+    assert response.result["state"] == TaskState.COMPLETED
+    partials = [e["partialMessage"]["parts"][0]["text"] for e in events[1:-1]]
+    assert partials == ["Hello", " streaming", " world"]
+    task = task_manager.get_task("task-1")
+    assert task.messages[-1].parts == [
+        {"type": "text", "text": "Hello streaming world"}
+    ]
+
+
+@pytest.mark.asyncio
+async def test_routing_by_skill():
+    """Test routing to registered handlers and rejection of unknown skills."""
+
+    async def summarize(task):
+        return "summary"
+
+    handlers = HandlerRegistry(default=EchoHandler())
+    handlers.register("summarize", summarize)
+    handlers.register("fail", lambda task: 1 / 0)
+    task_manager = TaskManager(handlers=handlers)
+
+    response = await task_manager.on_send_task(_request("t1", skill="summarize"))
+    assert response.result["message"]["parts"] == [{"type": "text", "text": "summary"}]
+
+    response = await task_manager.on_send_task(_request("t2", skill="fail"))
+    assert response.result["state"] == TaskState.FAILED
+
+    response = await task_manager.on_send_task(_request("t3", agentId="unknown"))
+    assert response.error["code"] == -32602
+
+
+@pytest.mark.asyncio
+async def test_handler_sees_task_deadline():
+    """Test that handlers see the task deadline shrink as they run."""
+    seen = []
+
+    async def outbound(task):
+        seen.append(remaining_timeout(60))
+        await asyncio.sleep(0.05)
+        seen.append(remaining_timeout(60))
+        assert not current_deadline().expired
+        yield "done"
+
+    task_manager = TaskManager(handlers=HandlerRegistry(outbound))
+    response = await task_manager.on_send_task(_request("t1", timeout=5))
+
+    assert response.result["state"] == TaskState.COMPLETED
+    assert 4.9 < seen[0] <= 5
+    assert seen[1] <= seen[0] - 0.04
+    # Outside the task there is no deadline to apply
+    assert current_deadline() is None
+    assert remaining_timeout(60) == 60
@@ -0,0 +1,115 @@
+"""Unit tests for task indexes and the tasks/list method."""
+
+import base64
+import json
+from datetime import datetime, timedelta
+
+import pytest
+
+from mcp_server.api.handlers.tasks import TasksHandler
+from mcp_server.api.jsonrpc import INVALID_PARAMS, MethodRegistry
+from mcp_server.models.task import Message, Task, TaskState
+from mcp_server.services.task_index import TaskIndex
+from mcp_server.services.task_manager import TaskManager
+
+START = datetime(2026, 1, 1)
+
+
+def _task(task_id, session_id, state, minute):
+    return Task(
+        id=task_id,
+        session_id=session_id,
+        state=state,
+        messages=[Message(role="user", parts=[{"type": "text", "text": "Hi"}])],
+        created_at=START,
+        updated_at=START + timedelta(minutes=minute),
+    )
+
+
+def test_index_pages_newest_first():
+    """Test filtered pagination and re-indexing after a state change."""
+    index = TaskIndex()
+    for minute in range(5):
+        state = TaskState.COMPLETED if minute % 2 else TaskState.ACTIVE
+        index.add(_task(f"t{minute}", "s1", state, minute))
+    index.add(_task("other", "s2", TaskState.COMPLETED, 10))
+
+    page, after = index.page(2, session_id="s1")
+    assert page == ["t4", "t3"]
+    page, after = index.page(2, session_id="s1", after=after)
+    assert page == ["t2", "t1"]
+    page, after = index.page(2, session_id="s1", after=after)
+    assert page == ["t0"] and after is None
+
+    assert index.page(10, state=TaskState.COMPLETED)[0] == ["other", "t3", "t1"]
+    assert index.page(10, updated_after=START + timedelta(minutes=2))[0] == [
+        "other",
+        "t4",
+        "t3",
+    ]
+
+    # t0 finishes: it moves to the front and to the COMPLETED indexes
+    index.add(_task("t0", "s1", TaskState.COMPLETED, 20))
+    assert index.page(1, session_id="s1")[0] == ["t0"]
+    assert index.page(10, session_id="s1", state=TaskState.ACTIVE)[0] == [
+        "t4",
+        "t2",
+    ]
+
+    assert index.remove("other")
+    assert index.page(10, session_id="s2") == ([], None)
+    assert len(index) == 5
+
+
+@pytest.mark.asyncio
+async def test_tasks_list_method():
+    """Test the tasks/list JSON-RPC method with cursor pagination."""
+    task_manager = TaskManager()
+    for minute in range(3):
+        task_manager._add_task(_task(f"t{minute}", "s1", TaskState.ACTIVE, minute))
+    methods = MethodRegistry()
+    TasksHandler(task_manager, methods)
+
+    def request(params):
+        return json.dumps(
+            {"jsonrpc": "2.0", "id": 1, "method": "tasks/list", "params": params}
+        )
+
+    response = await methods.dispatch(request({"sessionId": "s1", "limit": 2}))
+    result = response["result"]
+    assert [task["id"] for task in result["tasks"]] == ["t2", "t1"]
+
+    response = await methods.dispatch(
+        request({"sessionId": "s1", "limit": 2, "cursor": result["nextCursor"]})
+    )
+    assert [task["id"] for task in response["result"]["tasks"]] == ["t0"]
+    assert response["result"]["nextCursor"] is None
+
+    aware = base64.urlsafe_b64encode(b'["2026-01-01T00:00:00+00:00", "t1"]')
+    for cursor in ("bogus", aware.decode("ascii")):
+        response = await methods.dispatch(request({"cursor": cursor}))
+        assert response["error"]["code"] == INVALID_PARAMS
+
+
+def test_evict_expired_keeps_unfinished_tasks():
+    """Test that only finished tasks past the retention period are evicted."""
+    task_manager = TaskManager()
+    task_manager.retention = 3600
+    now = datetime.utcnow()
+    for task_id, state, age in [
+        ("old-done", TaskState.COMPLETED, 7200),
+        ("old-failed", TaskState.FAILED, 7200),
+        ("old-active", TaskState.ACTIVE, 7200),
+        ("new-done", TaskState.COMPLETED, 60),
+    ]:
+        task = _task(task_id, "s1", state, 0)
+        task.updated_at = now - timedelta(seconds=age)
+        task_manager._add_task(task)
+
+    queue = task_manager.get_or_create_stream_queue("old-done")
+
+    assert task_manager.evict_expired() == 2
+    assert set(task_manager.tasks) == {"old-active", "new-done"}
+    assert len(task_manager.index) == 2
+    assert not task_manager.stream_queues
+    assert queue.get_nowait() is None
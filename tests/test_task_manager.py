@@ -1,11 +1,23 @@
 """Unit tests for the TaskManager service."""
 
 import asyncio
+import json
+
 import pytest
+from aiohttp.test_utils import TestClient, TestServer
+from pydantic import ValidationError
 
+from mcp_server.app import create_app
 from mcp_server.services.task_manager import TaskManager
-from mcp_server.models.request import SendTaskRequest, SubscribeTaskRequest
+from mcp_server.models.request import (
+    SendTaskRequest,
+    SubscribeTaskRequest,
+    TaskSendParams,
+)
 from mcp_server.models.task import TaskState
+from mcp_server.services.deadline import resolve_timeout
+from mcp_server.services.persistence import FilePersistenceLayer
+from mcp_server.services.task_handlers import EchoHandler, HandlerRegistry
 
 
 @pytest.fixture
@@ -44,4 +56,120 @@ async def test_on_send_task(task_manager):
     assert task is not None
     assert task.id == "task-1"
     assert task.session_id == "session-1"
-    assert len(task.messages) == 2  # User message and response
\ No newline at end of file
+    assert len(task.messages) == 2  # User message and response
+    # Nothing buffers events for streams nobody reads
+    assert not task_manager.stream_queues
+
+
+@pytest.mark.asyncio
+async def test_subscribe_task_times_out():
+    """Test that a task exceeding its deadline is moved to FAILED."""
+    task_manager = TaskManager(handlers=HandlerRegistry(EchoHandler(delay=1)))
+    request = SubscribeTaskRequest(
+        id="req-2",
+        params={
+            "id": "task-2",
+            "timeout": 0.05,
+            "message": {"role": "user", "parts": [{"type": "text", "text": "Hi"}]},
+        },
+    )
+
+    await task_manager.on_subscribe_task(request)
+    queue = task_manager.get_or_create_stream_queue("task-2")
+    assert await queue.get() == {"state": TaskState.PROCESSING}
+    event = await asyncio.wait_for(queue.get(), timeout=1)
+
+    task = task_manager.get_task("task-2")
+    assert task.state == TaskState.FAILED
+    assert "timed out" in task.error
+    assert event == {"state": TaskState.FAILED, "error": task.error}
+
+
+def test_resolve_timeout_clamps_to_maximum():
+    """Test that client timeouts are validated and clamped."""
+    assert resolve_timeout("5", default=30, maximum=60) == 5
+    assert resolve_timeout(None, default=30, maximum=60) == 30
+    assert resolve_timeout("bogus", default=30, maximum=60) == 30
+    assert resolve_timeout(-1, default=30, maximum=60) == 30
+    assert resolve_timeout(600, default=30, maximum=60) == 60
+    assert resolve_timeout("nan", default=30, maximum=60) == 30
+    assert resolve_timeout(float("inf"), default=30, maximum=60) == 30
+
+
+@pytest.mark.parametrize("timeout", ["nan", "inf", -1, 0])
+def test_invalid_timeout_param_is_rejected(timeout):
+    """Test that params reject timeouts that are not positive and finite."""
+    with pytest.raises(ValidationError):
+        TaskSendParams(
+            id="task-x",
+            message={"role": "user", "parts": []},
+            timeout=timeout,
+        )
+
+
+@pytest.mark.asyncio
+async def test_restore_from_persistence(tmp_path):
+    """Test that persisted tasks are replayed into a new TaskManager."""
+    persistence_layer = FilePersistenceLayer(str(tmp_path))
+    first = TaskManager(persistence_layer=persistence_layer)
+    await first.on_send_task(
+        SendTaskRequest(
+            id="req-3",
+            params={
+                "id": "task-3",
+                "message": {"role": "user", "parts": [{"type": "text", "text": "Hi"}]},
+            },
+        )
+    )
+
+    second = TaskManager(persistence_layer=persistence_layer)
+    assert await second.restore() == 1
+    assert second.get_task("task-3").messages[0].role == "user"
+
+
+@pytest.mark.asyncio
+async def test_stream_of_finished_task_ends():
+    """Test that streaming a finished task sends its snapshot and closes."""
+    app = await create_app()
+    task_manager = app["task_manager"]
+    async with TestClient(TestServer(app)) as client:
+        message = {"role": "user", "parts": [{"type": "text", "text": "Hi"}]}
+        await task_manager.on_send_task(
+            SendTaskRequest(id="req-9", params={"id": "task-9", "message": message})
+        )
+        for encoding in ("identity", "gzip"):
+            response = await client.get(
+                "/tasks/task-9/stream", headers={"Accept-Encoding": encoding}
+            )
+            body = await asyncio.wait_for(response.read(), timeout=2)
+            snapshot = json.loads(body.decode("utf-8").removeprefix("data: "))
+            assert snapshot["state"] == TaskState.COMPLETED
+        assert not task_manager.stream_queues
+
+
+@pytest.mark.asyncio
+async def test_running_task_id_cannot_be_reused():
+    """Test that a running task is not replaced by a new one with its ID."""
+    task_manager = TaskManager(handlers=HandlerRegistry(EchoHandler(delay=0.1)))
+    message = {"role": "user", "parts": [{"type": "text", "text": "Hi"}]}
+    params = {"id": "task-x", "sessionId": "s1", "message": message}
+    await task_manager.on_subscribe_task(SubscribeTaskRequest(id="r1", params=params))
+
+    response = await task_manager.on_send_task(
+        SendTaskRequest(id="r2", params={**params, "sessionId": "s2"})
+    )
+    assert response.error["code"] == -32602
+    await task_manager.shutdown(timeout=5)
+
+    tasks, _ = task_manager.list_tasks(10, session_id="s1")
+    assert [task.id for task in tasks] == ["task-x"]
+    assert tasks[0].state == TaskState.COMPLETED
+
+    # A finished task's ID may be used again
+    task_manager.accepting = True
+    response = await task_manager.on_send_task(
+        SendTaskRequest(id="r3", params={**params, "sessionId": "s2"})
+    )
+    assert response.result["state"] == TaskState.COMPLETED
+    assert task_manager.list_tasks(10, session_id="s1")[0] == []
+    assert len(task_manager.list_tasks(10, session_id="s2")[0]) == 1
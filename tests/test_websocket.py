@@ -0,0 +1,88 @@
+"""Unit tests for the WebSocket transport."""
+
+import asyncio
+
+import pytest
+from aiohttp.test_utils import TestClient, TestServer
+
+from mcp_server.app import create_app
+from mcp_server.models.task import TaskState
+from mcp_server.services.task_handlers import EchoHandler
+
+
+def _send_subscribe(request_id, task_id):
+    return {
+        "jsonrpc": "2.0",
+        "id": request_id,
+        "method": "tasks/sendSubscribe",
+        "params": {
+            "id": task_id,
+            "timeout": 10,
+            "message": {"role": "user", "parts": [{"type": "text", "text": "Hi"}]},
+        },
+    }
+
+
+@pytest.mark.asyncio
+async def test_multiplexed_task_streams():
+    """Test that one socket receives interleaved events for several tasks."""
+    app = await create_app()
+    async with TestClient(TestServer(app)) as client:
+        ws = await client.ws_connect("/ws")
+        await ws.send_json(_send_subscribe(1, "ws-task-1"))
+        await ws.send_json(_send_subscribe(2, "ws-task-2"))
+
+        responses = {}
+        completed = set()
+        while len(completed) < 2:
+            message = await ws.receive_json(timeout=10)
+            if "id" in message:
+                responses[message["id"]] = message
+            elif message["params"]["event"].get("state") == "completed":
+                completed.add(message["params"]["taskId"])
+
+        assert responses[1]["result"]["taskId"] == "ws-task-1"
+        assert responses[2]["result"]["taskId"] == "ws-task-2"
+        assert completed == {"ws-task-1", "ws-task-2"}
+        assert not app["task_manager"].listeners
+        await ws.close()
+
+
+@pytest.mark.asyncio
+async def test_subscribe_unknown_task():
+    """Test that subscribing to a missing task returns an error."""
+    app = await create_app()
+    async with TestClient(TestServer(app)) as client:
+        ws = await client.ws_connect("/ws")
+        await ws.send_json(
+            {
+                "jsonrpc": "2.0",
+                "id": 1,
+                "method": "tasks/subscribe",
+                "params": {"id": "missing"},
+            }
+        )
+        message = await ws.receive_json(timeout=5)
+        assert message["error"]["code"] == -32001
+        await ws.close()
+
+
+@pytest.mark.asyncio
+async def test_disconnect_does_not_cancel_task():
+    """Test that a task sent over a closed socket still runs to completion."""
+    app = await create_app()
+    task_manager = app["task_manager"]
+    task_manager.handlers.default = EchoHandler(delay=0.2)
+    async with TestClient(TestServer(app)) as client:
+        ws = await client.ws_connect("/ws")
+        request = _send_subscribe(1, "ws-task-3")
+        request["method"] = "tasks/send"
+        await ws.send_json(request)
+        while task_manager.get_task("ws-task-3") is None:
+            await asyncio.sleep(0.01)
+        await ws.close()
+
+        runner = task_manager._running.get("ws-task-3")
+        if runner is not None:
+            await asyncio.wait_for(runner, timeout=5)
+        assert task_manager.get_task("ws-task-3").state == TaskState.COMPLETED